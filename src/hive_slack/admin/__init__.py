@@ -1,23 +1,103 @@
 """Admin Web UI for Amplifier Hive Slack.
 
 Optional NiceGUI-based admin panel that runs alongside the bot.
-Import guard: if nicegui is not installed, this module is never loaded.
+This package module itself needs only the stdlib: the bot's connection and
+service layers publish state events through ``manager`` whether or not the
+UI runs. The NiceGUI pages are only imported by ``create_admin_app``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import time
+from typing import Iterable
 
 
 logger = logging.getLogger(__name__)
 
+# Per-client event queue depth. A client that falls this far behind is
+# dropping events anyway -- better to lose a few than block the loop.
+_QUEUE_MAXSIZE = 1000
+
+
+class ConnectionManager:
+    """Fan out admin events to every connected browser client.
+
+    Each client subscribes with its own asyncio.Queue, optionally limited
+    to some event types. ``broadcast`` is safe to call from any thread (log
+    handlers run wherever the record was emitted) -- delivery is hopped
+    onto the admin event loop.
+
+    Event types: ``log_append`` (batched log records), ``log_error`` (a
+    WARNING+ record was logged), ``connection`` (Slack socket state) and
+    ``service`` (session manager state).
+    """
+
+    def __init__(self) -> None:
+        # Client queue -> event types it wants (None = everything)
+        self._queues: dict[asyncio.Queue[dict], frozenset[str] | None] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        """True if at least one client is listening."""
+        return bool(self._queues)
+
+    def subscribe(self, types: Iterable[str] | None = None) -> asyncio.Queue[dict]:
+        """Register a new client queue. Must be called on the event loop.
+
+        If ``types`` is given, only events of those types are delivered.
+        """
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._queues[queue] = frozenset(types) if types is not None else None
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict]) -> None:
+        """Remove a client queue (on disconnect)."""
+        self._queues.pop(queue, None)
+
+    def broadcast(self, event: dict) -> None:
+        """Publish an event to all subscribers. Non-blocking, thread-safe."""
+        if self._queues:
+            self.call_soon_threadsafe(self._deliver, event)
+
+    def call_soon_threadsafe(self, callback, *args) -> None:
+        """Run ``callback`` on the admin event loop, from any thread."""
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # Loop closed during shutdown -- nobody left to notify
+
+    def _deliver(self, event: dict) -> None:
+        for queue, types in self._queues.items():
+            if types is not None and event["type"] not in types:
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+
+
+# Shared broadcast channel for all admin pages
+manager = ConnectionManager()
+
 # Global references to bot components (set by create_admin_app)
 _service = None
 _connector = None
 _config = None
 _start_time: float = 0.0
 
+# Environment snapshots taken once by create_admin_app, so page renders
+# and auth checks don't re-read os.environ on every request.
+_provider_info: tuple[str, str] | None = None
+_password_hash: str | None = None
+
 
 def create_admin_app(service, connector, config) -> None:
     """Initialize the admin UI and register all pages.
@@ -27,11 +107,22 @@ def create_admin_app(service, connector, config) -> None:
     so all pages can read state directly.
     """
     global _service, _connector, _config, _start_time
+    global _provider_info, _password_hash
     _service = service
     _connector = connector
     _config = config
     _start_time = time.time()
 
+    from hive_slack.admin.configuration import _detect_provider_info
+
+    _provider_info = _detect_provider_info()
+    _password_hash = os.environ.get("ADMIN_PASSWORD_HASH", "")
+
+    # Capture log records for the dashboard and log viewer
+    from hive_slack.admin import _log_sink
+
+    _log_sink.install()
+
     # Set up authentication (login page + session storage)
     from hive_slack.admin.auth import is_auth_enabled, setup_login_page
 
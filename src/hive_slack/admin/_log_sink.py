@@ -0,0 +1,97 @@
+"""Single root-logger handler feeding the admin log viewer and dashboard.
+
+One handler means one lock acquisition and one tuple allocation per
+record, shared by the 2000-entry log ring and the 50-entry error deque.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import NamedTuple
+
+import hive_slack.admin as admin_state
+
+
+class LogRec(NamedTuple):
+    """Raw log entry. Formatting is deferred until a client displays it."""
+
+    created: float
+    levelno: int
+    name: str
+    msg: object
+    args: tuple | dict | None
+
+
+# Ring buffer for the log viewer
+_MAX_RECORDS = 2000
+_log_buffer: deque[LogRec] = deque(maxlen=_MAX_RECORDS)
+
+# WARNING+ entries for the dashboard (same tuples as the ring buffer)
+_MAX_ERRORS = 50
+_recent_errors: deque[LogRec] = deque(maxlen=_MAX_ERRORS)
+
+
+class _AdminSink(logging.Handler):
+    """Capture log records for all admin pages."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        global _pending_error
+        entry = LogRec(
+            record.created, record.levelno, record.name, record.msg, record.args
+        )
+        _log_buffer.append(entry)
+        is_error = record.levelno >= logging.WARNING
+        if is_error:
+            _recent_errors.append(entry)
+        if admin_state.manager.has_subscribers:
+            _pending.append(entry)
+            if is_error:
+                _pending_error = True
+            if _flush_handle is None:
+                admin_state.manager.call_soon_threadsafe(_arm_flush)
+
+
+# Records waiting to be pushed to clients. Bursty logging is coalesced
+# into one "log_append" broadcast per window instead of one per record.
+_BATCH_WINDOW = 0.25
+_pending: list[LogRec] = []
+# Set when a WARNING+ record is waiting, so the dashboard's error list is
+# refreshed once per window rather than woken by every log record.
+_pending_error = False
+_flush_handle: asyncio.TimerHandle | None = None
+
+
+def _arm_flush() -> None:
+    """Schedule a batch flush if one isn't pending (runs on the event loop)."""
+    global _flush_handle
+    if _flush_handle is None:
+        loop = asyncio.get_running_loop()
+        _flush_handle = loop.call_later(_BATCH_WINDOW, _flush)
+
+
+def _flush() -> None:
+    """Broadcast everything accumulated since the last flush."""
+    global _flush_handle, _pending_error
+    _flush_handle = None
+    batch = _pending[:]
+    # Only drop what we copied -- other threads may have appended meanwhile
+    del _pending[: len(batch)]
+    if batch:
+        admin_state.manager.broadcast({"type": "log_append", "records": batch})
+    if _pending_error:
+        _pending_error = False
+        admin_state.manager.broadcast({"type": "log_error"})
+
+
+_sink: _AdminSink | None = None
+
+
+def install() -> None:
+    """Attach the sink to the root logger. Safe to call more than once."""
+    global _sink
+    if _sink is None:
+        _sink = _AdminSink()
+        _sink.setLevel(logging.DEBUG)
+        logging.getLogger().addHandler(_sink)
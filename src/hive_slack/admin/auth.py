@@ -9,6 +9,8 @@ a secure cookie-based session store built into NiceGUI.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import hmac
 import logging
@@ -16,13 +18,21 @@ import os
 
 from nicegui import app, ui
 
+import hive_slack.admin as admin_state
+
 logger = logging.getLogger(__name__)
 
 SESSION_KEY = "admin_authenticated"
 
 
 def get_password_hash() -> str:
-    """Get the configured password hash, or empty string for no-auth mode."""
+    """Get the configured password hash, or empty string for no-auth mode.
+
+    Uses the snapshot taken by create_admin_app; reads the environment
+    only if called before the admin app was created.
+    """
+    if admin_state._password_hash is not None:
+        return admin_state._password_hash
     return os.environ.get("ADMIN_PASSWORD_HASH", "")
 
 
@@ -38,13 +48,23 @@ def is_authenticated() -> bool:
     return app.storage.user.get(SESSION_KEY, False)
 
 
+@functools.lru_cache(maxsize=1)
+def _expected_digest(password_hash: str) -> bytes:
+    """Decode the configured hex hash once. Empty if it isn't valid hex."""
+    try:
+        return bytes.fromhex(password_hash)
+    except ValueError:
+        logger.warning("ADMIN_PASSWORD_HASH is not a valid hex digest")
+        return b""
+
+
 def verify_password(password: str) -> bool:
     """Verify a password against the stored hash."""
     expected = get_password_hash()
     if not expected:
         return True
-    actual = hashlib.sha256(password.encode()).hexdigest()
-    return hmac.compare_digest(actual, expected)
+    actual = hashlib.sha256(password.encode()).digest()
+    return hmac.compare_digest(actual, _expected_digest(expected))
 
 
 def require_auth() -> bool:
@@ -77,8 +97,9 @@ def setup_login_page() -> None:
 
             error_label = ui.label("").classes("text-red-600")
 
-            def do_login():
-                if verify_password(password_input.value):
+            async def do_login():
+                # Hash off the event loop so other admin clients stay responsive
+                if await asyncio.to_thread(verify_password, password_input.value):
                     app.storage.user[SESSION_KEY] = True
                     ui.navigate.to("/admin")
                 else:
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
-from nicegui import ui
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from nicegui import app, ui
 
 import hive_slack.admin as admin_state
-from hive_slack.admin.shared import admin_layout
-from hive_slack.admin.auth import require_auth
+from hive_slack.admin.shared import (
+    PAGE_COLUMN,
+    PAGE_TITLE,
+    admin_layout,
+    cached_json,
+)
+from hive_slack.admin.auth import is_authenticated, require_auth
 
 
 def _mask_key(key: str) -> str:
@@ -41,6 +51,131 @@ def _format_size(size: int) -> str:
     return f"{size / (1024 * 1024):.1f} MB"
 
 
+@dataclass
+class _DirListing:
+    """Snapshot of a working directory for the file browser."""
+
+    dir_count: int
+    file_count: int
+    total: int
+    dirs: list[str]  # First 20 directory names
+    files: list[tuple[str, int | None]]  # First 30 (name, size) -- None if stat failed
+
+
+# Directory listings keyed by path: (dir mtime, cached at, listing).
+# Re-scanned when the directory changes or the entry is older than the TTL
+# (file size changes don't bump the directory mtime).
+_DIR_CACHE_TTL = 10.0
+_dir_cache: dict[Path, tuple[float, float, _DirListing]] = {}
+
+
+def _scan_dir(path: Path) -> _DirListing:
+    """Walk a directory and stat the files we'll display. Blocking."""
+    entries = sorted(path.iterdir())
+    dirs = [e for e in entries if e.is_dir()]
+    regular = [e for e in entries if e.is_file()]
+
+    files: list[tuple[str, int | None]] = []
+    for f in regular[:30]:
+        try:
+            files.append((f.name, f.stat().st_size))
+        except OSError:
+            files.append((f.name, None))
+
+    return _DirListing(
+        dir_count=len(dirs),
+        file_count=len(regular),
+        total=len(entries),
+        dirs=[d.name for d in dirs[:20]],
+        files=files,
+    )
+
+
+async def _list_dir(path: Path) -> _DirListing:
+    """Cached directory listing; the scan itself runs off the event loop."""
+    mtime = path.stat().st_mtime
+    now = time.monotonic()
+    cached = _dir_cache.get(path)
+    if cached and cached[0] == mtime and now - cached[1] < _DIR_CACHE_TTL:
+        return cached[2]
+
+    listing = await asyncio.to_thread(_scan_dir, path)
+    _dir_cache[path] = (mtime, now, listing)
+    return listing
+
+
+def _render_listing(listing: _DirListing) -> None:
+    """Render a directory listing into the current container."""
+    ui.label(
+        f"Files: {listing.file_count} files, {listing.dir_count} directories"
+    ).classes("text-sm text-gray-400")
+    for d in listing.dirs:
+        ui.label(f"📁 {d}/").classes("text-sm font-mono")
+    for fname, fsize in listing.files:
+        size = _format_size(fsize) if fsize is not None else "?"
+        ui.label(f"📄 {fname}  ({size})").classes("text-sm font-mono")
+    if listing.total > 50:
+        ui.label(f"... and {listing.total - 50} more").classes(
+            "text-sm text-gray-400"
+        )
+
+
+def _file_browser(name: str, path: Path) -> None:
+    """Expansion that scans ``path`` the first time it is opened."""
+    expansion = ui.expansion(f"Browse files: {name}", icon="folder").classes(
+        "w-full"
+    )
+    loaded = [False]
+
+    async def load(e) -> None:
+        if not e.value or loaded[0]:
+            return
+        loaded[0] = True
+        try:
+            listing = await _list_dir(path)
+        except OSError:
+            listing = None
+        with expansion:
+            if listing is None:
+                ui.label("Working directory does not exist").classes(
+                    "text-sm text-orange-600"
+                )
+            else:
+                _render_listing(listing)
+
+    expansion.on_value_change(load)
+
+
+@app.get("/admin/api/config.json")
+async def config_api(request: Request) -> Response:
+    """Running configuration as JSON, revalidated by ETag."""
+    if not is_authenticated():
+        return JSONResponse({"error": "unauthorized"}, status_code=401)
+    config = admin_state._config
+    provider_name, masked_key = (
+        admin_state._provider_info or _detect_provider_info()
+    )
+    instances = {}
+    if config is not None:
+        instances = {
+            name: {
+                "persona": inst.persona.name,
+                "emoji": inst.persona.emoji,
+                "bundle": inst.bundle,
+                "working_dir": inst.working_dir,
+            }
+            for name, inst in config.instances.items()
+        }
+    return cached_json(
+        request,
+        {
+            "instances": instances,
+            "default_instance": getattr(config, "default_instance", None),
+            "provider": {"name": provider_name, "key": masked_key},
+        },
+    )
+
+
 @ui.page("/admin/config")
 def config_page() -> None:
     """Render the configuration viewer page."""
@@ -50,8 +185,8 @@ def config_page() -> None:
 
     config = admin_state._config
 
-    with ui.column().classes("w-full max-w-4xl mx-auto p-4 gap-4"):
-        ui.label("Configuration").classes("text-xl font-bold")
+    with ui.column().classes(PAGE_COLUMN):
+        ui.label("Configuration").classes(PAGE_TITLE)
         ui.label("Read-only view of the running configuration.").classes(
             "text-gray-500"
         )
@@ -60,59 +195,55 @@ def config_page() -> None:
             ui.label("No configuration loaded.").classes("text-red-600")
             return
 
-        # Instances
+        # Instances -- one table; file listings load only when expanded
         ui.label("Instances").classes("text-lg font-bold mt-4")
+        ui.table(
+            columns=[
+                {
+                    "name": "persona",
+                    "label": "Instance",
+                    "field": "persona",
+                    "align": "left",
+                },
+                {
+                    "name": "name",
+                    "label": "Name",
+                    "field": "name",
+                    "align": "left",
+                },
+                {
+                    "name": "bundle",
+                    "label": "Bundle",
+                    "field": "bundle",
+                    "align": "left",
+                },
+                {
+                    "name": "working_dir",
+                    "label": "Working Dir",
+                    "field": "working_dir",
+                    "align": "left",
+                },
+            ],
+            rows=[
+                {
+                    "persona": f"{inst.persona.emoji} {inst.persona.name}",
+                    "name": name,
+                    "bundle": inst.bundle,
+                    "working_dir": inst.working_dir,
+                }
+                for name, inst in config.instances.items()
+            ],
+            row_key="name",
+        ).classes("w-full")
+
         for name, inst in config.instances.items():
-            with ui.card().classes("w-full"):
-                ui.label(
-                    f"{inst.persona.emoji} {inst.persona.name}"
-                ).classes("text-lg font-bold")
-                with ui.grid(columns=2).classes("gap-x-4 gap-y-1"):
-                    ui.label("Name:").classes("text-gray-500")
-                    ui.label(name)
-                    ui.label("Bundle:").classes("text-gray-500")
-                    ui.label(inst.bundle)
-                    ui.label("Working Dir:").classes("text-gray-500")
-                    ui.label(inst.working_dir)
-
-                # File listing for working dir
-                working_path = Path(inst.working_dir).expanduser()
-                if working_path.exists():
-                    files = sorted(working_path.iterdir())
-                    dirs = [f for f in files if f.is_dir()]
-                    regular = [f for f in files if f.is_file()]
-                    ui.label(
-                        f"Files: {len(regular)} files, "
-                        f"{len(dirs)} directories"
-                    ).classes("text-sm text-gray-400 mt-2")
-
-                    with ui.expansion("Browse files", icon="folder").classes(
-                        "w-full"
-                    ):
-                        for d in dirs[:20]:
-                            ui.label(f"📁 {d.name}/").classes(
-                                "text-sm font-mono"
-                            )
-                        for f in regular[:30]:
-                            try:
-                                size = _format_size(f.stat().st_size)
-                            except Exception:
-                                size = "?"
-                            ui.label(f"📄 {f.name}  ({size})").classes(
-                                "text-sm font-mono"
-                            )
-                        if len(files) > 50:
-                            ui.label(
-                                f"... and {len(files) - 50} more"
-                            ).classes("text-sm text-gray-400")
-                else:
-                    ui.label(
-                        "Working directory does not exist"
-                    ).classes("text-sm text-orange-600")
+            _file_browser(name, Path(inst.working_dir).expanduser())
 
         # AI Provider
         ui.label("AI Provider").classes("text-lg font-bold mt-4")
-        provider_name, masked_key = _detect_provider_info()
+        provider_name, masked_key = (
+            admin_state._provider_info or _detect_provider_info()
+        )
         with ui.card().classes("w-full"):
             with ui.grid(columns=2).classes("gap-x-4 gap-y-1"):
                 ui.label("Provider:").classes("text-gray-500")
@@ -131,16 +262,24 @@ def config_page() -> None:
             restart_result = ui.label("")
 
             async def restart_service():
-                import subprocess
-
                 try:
-                    result = subprocess.run(
-                        ["systemctl", "--user", "restart", "hive-slack"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
+                    proc = await asyncio.create_subprocess_exec(
+                        "systemctl",
+                        "--user",
+                        "restart",
+                        "hive-slack",
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
                     )
-                    if result.returncode == 0:
+                    try:
+                        _, stderr = await asyncio.wait_for(
+                            proc.communicate(), timeout=10
+                        )
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                        await proc.wait()
+                        raise
+                    if proc.returncode == 0:
                         restart_result.text = (
                             "Service restart initiated. "
                             "Page will reconnect shortly."
@@ -148,9 +287,12 @@ def config_page() -> None:
                         restart_result.classes("text-green-600")
                     else:
                         restart_result.text = (
-                            f"Restart failed: {result.stderr}"
+                            f"Restart failed: {stderr.decode(errors='replace')}"
                         )
                         restart_result.classes("text-red-600")
+                except asyncio.TimeoutError:
+                    restart_result.text = "Error: systemctl timed out after 10s"
+                    restart_result.classes("text-red-600")
                 except Exception as e:
                     restart_result.text = f"Error: {e}"
                     restart_result.classes("text-red-600")
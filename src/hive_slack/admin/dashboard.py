@@ -2,37 +2,22 @@
 
 from __future__ import annotations
 
-import logging
 import time
+from collections import Counter
 
 from nicegui import ui
 
 import hive_slack.admin as admin_state
-from hive_slack.admin.shared import admin_layout, format_uptime
+from hive_slack.admin.shared import (
+    PAGE_COLUMN,
+    SECTION_TITLE,
+    admin_layout,
+    format_log_message,
+    format_uptime,
+    subscribe_events,
+)
 from hive_slack.admin.auth import require_auth
-
-
-# Ring buffer for recent log errors
-_recent_errors: list[str] = []
-_MAX_ERRORS = 50
-
-
-class _ErrorCapture(logging.Handler):
-    """Capture WARNING+ log records for the dashboard error display."""
-
-    def emit(self, record: logging.LogRecord) -> None:
-        if record.levelno >= logging.WARNING:
-            ts = time.strftime("%H:%M", time.localtime(record.created))
-            msg = f"{ts}  {record.getMessage()}"
-            _recent_errors.append(msg)
-            if len(_recent_errors) > _MAX_ERRORS:
-                _recent_errors.pop(0)
-
-
-# Install the error capture handler on the root logger
-_error_handler = _ErrorCapture()
-_error_handler.setLevel(logging.WARNING)
-logging.getLogger().addHandler(_error_handler)
+from hive_slack.admin._log_sink import _recent_errors
 
 
 @ui.page("/admin")
@@ -46,20 +31,20 @@ def dashboard_page() -> None:
     connector = admin_state._connector
     config = admin_state._config
 
-    with ui.column().classes("w-full max-w-4xl mx-auto p-4 gap-4"):
+    with ui.column().classes(PAGE_COLUMN):
         # Status cards row
         with ui.row().classes("gap-4 w-full"):
             # Bot status card
             with ui.card().classes("flex-1"):
                 bot_icon = ui.icon("circle", color="grey").classes("text-2xl")
-                ui.label("Bot").classes("text-lg font-bold")
+                ui.label("Bot").classes(SECTION_TITLE)
                 bot_status = ui.label("Checking...")
                 bot_uptime = ui.label("")
 
             # Slack connection card
             with ui.card().classes("flex-1"):
                 slack_icon = ui.icon("circle", color="grey").classes("text-2xl")
-                ui.label("Slack").classes("text-lg font-bold")
+                ui.label("Slack").classes(SECTION_TITLE)
                 slack_status = ui.label("Checking...")
                 slack_workspace = ui.label("")  # noqa: F841
 
@@ -71,7 +56,7 @@ def dashboard_page() -> None:
                 ui.label("Active Sessions")
 
         # Instances table
-        ui.label("Instances").classes("text-lg font-bold")
+        ui.label("Instances").classes(SECTION_TITLE)
         instances_table = ui.table(
             columns=[
                 {
@@ -100,58 +85,115 @@ def dashboard_page() -> None:
                 },
             ],
             rows=[],
+            row_key="name",
         ).classes("w-full")
 
         # Recent errors
-        ui.label("Recent Errors").classes("text-lg font-bold")
+        ui.label("Recent Errors").classes(SECTION_TITLE)
         error_container = ui.column().classes("w-full")
 
+    # Rows currently held by the table, keyed by instance name
+    last_rows: dict[str, dict] = {}
+    # Fingerprint of the state last pushed to this client
+    last_fp: list[tuple | None] = [None]
+    # Slack socket state, kept current by "connection" events. The
+    # connector only copies bot_user_id once start() returns, so look at
+    # the connection it wraps for the initial value.
+    connected = [
+        bool(
+            getattr(getattr(connector, "_connection", None), "bot_user_id", "")
+            or getattr(connector, "_bot_user_id", "")
+        )
+    ]
+
     def refresh() -> None:
         """Refresh all dashboard data."""
         if service is None or config is None:
             return
 
-        # Bot status
         is_running = bool(getattr(service, "_prepared", None))
+        is_connected = connected[0]
+        sessions = getattr(service, "_sessions", {})
+        # Session keys are "<instance>:<conversation>" -- bucket them in one pass
+        counts = Counter(k.split(":", 1)[0] for k in sessions)
+
+        # Uptime ticks on its own; only touch it when the text changes
+        uptime = format_uptime(admin_state._start_time) if is_running else ""
+        if bot_uptime.text != uptime:
+            bot_uptime.text = uptime
+
+        # Nothing else changed since the last refresh -- send nothing
+        fp = (
+            is_running,
+            is_connected,
+            len(sessions),
+            tuple((name, counts.get(name, 0)) for name in config.instances),
+        )
+        if fp == last_fp[0]:
+            return
+        last_fp[0] = fp
+
+        # Bot status
         bot_icon.props(f'color={"green" if is_running else "red"}')
         bot_status.text = "Running" if is_running else "Stopped"
-        bot_uptime.text = (
-            format_uptime(admin_state._start_time) if is_running else ""
-        )
 
         # Slack status
-        is_connected = bool(getattr(connector, "_bot_user_id", ""))
         slack_icon.props(f'color={"green" if is_connected else "red"}')
         slack_status.text = "Connected" if is_connected else "Disconnected"
 
         # Session count
-        sessions = getattr(service, "_sessions", {})
         session_count.text = str(len(sessions))
 
-        # Instances table
-        rows = []
+        # Instances table -- only push the rows that changed
+        rows: dict[str, dict] = {}
         for name, inst in config.instances.items():
-            count = sum(1 for k in sessions if k.startswith(f"{name}:"))
-            rows.append(
-                {
-                    "persona": f"{inst.persona.emoji} {inst.persona.name}",
-                    "bundle": inst.bundle,
-                    "sessions": str(count),
-                    "working_dir": inst.working_dir,
-                }
-            )
-        instances_table.rows = rows
+            rows[name] = {
+                "name": name,
+                "persona": f"{inst.persona.emoji} {inst.persona.name}",
+                "bundle": inst.bundle,
+                "sessions": str(counts.get(name, 0)),
+                "working_dir": inst.working_dir,
+            }
+        if rows != last_rows:
+            if rows.keys() == last_rows.keys():
+                # Same instances: patch the row dicts the table holds (it
+                # keeps its own observable copies, not our dicts)
+                for current in instances_table.rows:
+                    current.update(rows[current["name"]])
+            else:
+                instances_table.rows = list(rows.values())
+            last_rows.clear()
+            last_rows.update(rows)
 
-        # Recent errors
+    def render_errors() -> None:
+        """Re-render the recent errors list."""
         error_container.clear()
         with error_container:
             if _recent_errors:
-                for err in _recent_errors[-10:]:
-                    ui.label(err).classes("text-sm text-red-600 font-mono")
+                for rec in list(_recent_errors)[-10:]:
+                    ts = time.strftime("%H:%M", time.localtime(rec.created))
+                    msg = format_log_message(rec.msg, rec.args)
+                    ui.label(f"{ts}  {msg}").classes(
+                        "text-sm text-red-600 font-mono"
+                    )
             else:
                 ui.label("No errors recorded.").classes(
                     "text-sm text-gray-400"
                 )
 
-    ui.timer(5.0, refresh)
+    def on_events(events: list[dict]) -> None:
+        """Update the dashboard from pushed events (no polling)."""
+        for e in events:
+            if e["type"] == "connection":
+                connected[0] = e["state"] != "disconnected"
+        if any(e["type"] == "log_error" for e in events):
+            render_errors()
+        if any(e["type"] != "log_error" for e in events):
+            refresh()
+
+    # Only state transitions and new errors -- not every log record
+    subscribe_events(on_events, types=("connection", "service", "log_error"))
+    # Heartbeat only -- keeps uptime fresh on an otherwise idle bot
+    ui.timer(30.0, refresh)
     refresh()
+    render_errors()
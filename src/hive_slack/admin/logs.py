@@ -4,38 +4,51 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import deque
+from itertools import islice
 
 from nicegui import ui
 
-import hive_slack.admin as admin_state  # noqa: F401
-from hive_slack.admin.shared import admin_layout
+from hive_slack.admin.shared import (
+    PAGE_TITLE,
+    WIDE_PAGE_COLUMN,
+    admin_layout,
+    format_log_message,
+    subscribe_events,
+)
 from hive_slack.admin.auth import require_auth
+from hive_slack.admin._log_sink import _MAX_RECORDS, LogRec, _log_buffer
 
-# Ring buffer for log records
-_log_buffer: deque[dict] = deque(maxlen=2000)
+# Display color per numeric log level
+_COLOR_BY_LEVELNO = {
+    logging.DEBUG: "text-gray-400",
+    logging.INFO: "text-gray-700",
+    logging.WARNING: "text-orange-600",
+    logging.ERROR: "text-red-600",
+    logging.CRITICAL: "text-red-800 font-bold",
+}
 
+# "Min Level" filter choices -> lowest levelno shown
+_MIN_LEVELNO = {
+    "ALL": 0,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
 
-class _RingBufferHandler(logging.Handler):
-    """Capture all log records into a ring buffer for the log viewer."""
 
-    def emit(self, record: logging.LogRecord) -> None:
-        _log_buffer.append(
-            {
-                "time": time.strftime(
-                    "%H:%M:%S", time.localtime(record.created)
-                ),
-                "level": record.levelname,
-                "name": record.name,
-                "message": record.getMessage(),
-            }
-        )
+# Display line template: time, level, logger name, message
+_FMT = "{0}  {1:8s}  {2:30s}  {3}".format
 
 
-# Install on root logger
-_ring_handler = _RingBufferHandler()
-_ring_handler.setLevel(logging.DEBUG)
-logging.getLogger().addHandler(_ring_handler)
+def _format_entry(entry: LogRec) -> str:
+    """Format a buffered entry as a display line."""
+    return _FMT(
+        time.strftime("%H:%M:%S", time.localtime(entry.created)),
+        logging.getLevelName(entry.levelno),
+        entry.name,
+        format_log_message(entry.msg, entry.args),
+    )
 
 
 @ui.page("/admin/logs")
@@ -45,82 +58,93 @@ def logs_page() -> None:
         return
     admin_layout("Logs")
 
-    with ui.column().classes("w-full max-w-5xl mx-auto p-4 gap-4"):
-        ui.label("Live Logs").classes("text-xl font-bold")
+    with ui.column().classes(WIDE_PAGE_COLUMN):
+        ui.label("Live Logs").classes(PAGE_TITLE)
 
         # Filters
         with ui.row().classes("gap-4 items-center"):
             level_filter = ui.select(
-                ["ALL", "DEBUG", "INFO", "WARNING", "ERROR"],
+                list(_MIN_LEVELNO),
                 value="INFO",
                 label="Min Level",
             ).classes("w-32")
             source_filter = ui.input(
                 "Filter by source", placeholder="e.g. hive_slack"
             ).classes("w-64")
-            ui.label(
-                f"Buffer: {len(_log_buffer)} / 2000 records"
-            ).classes("text-sm text-gray-400").bind_text_from(
-                level_filter,
-                "value",
-                backward=lambda _: (
-                    f"Buffer: {len(_log_buffer)} / 2000 records"
-                ),
-            )
+            buffer_label = ui.label("").classes("text-sm text-gray-400")
 
-        # Log display
+        # Log display (newest first)
         log_container = ui.column().classes("w-full font-mono text-sm")
 
-        _level_order = {
-            "DEBUG": 0,
-            "INFO": 1,
-            "WARNING": 2,
-            "ERROR": 3,
-            "CRITICAL": 4,
-        }
-
-        def refresh_logs() -> None:
-            """Refresh the log display."""
-            min_level = level_filter.value
+        empty = [False]  # True while the "no entries" placeholder is shown
+        buffer_len = [-1]  # Record count currently shown in buffer_label
+
+        def update_buffer_label() -> None:
+            n = len(_log_buffer)
+            if n != buffer_len[0]:
+                buffer_len[0] = n
+                buffer_label.text = f"Buffer: {n} / {_MAX_RECORDS} records"
+
+        def matches(record: LogRec) -> bool:
+            if record.levelno < _MIN_LEVELNO.get(level_filter.value, 0):
+                return False
             source = source_filter.value.strip().lower()
-            min_order = (
-                _level_order.get(min_level, 0) if min_level != "ALL" else -1
+            return not source or source in record.name.lower()
+
+        def add_line(record: LogRec) -> ui.label:
+            color = _COLOR_BY_LEVELNO.get(record.levelno, "text-gray-700")
+            return ui.label(_format_entry(record)).classes(
+                f"{color} whitespace-pre-wrap break-all"
             )
 
+        def recent_matches() -> list[LogRec]:
+            """Newest-first records passing the filters, at most 100."""
+            try:
+                # deque.__reversed__ walks in place -- no 2000-entry copy
+                return list(islice(filter(matches, reversed(_log_buffer)), 100))
+            except RuntimeError:
+                # Another thread appended mid-walk; fall back to a snapshot
+                snapshot = list(_log_buffer)
+                return list(islice(filter(matches, reversed(snapshot)), 100))
+
+        def render_logs() -> None:
+            """Fully re-render the log display (initial load and filter changes)."""
+            records = recent_matches()
             log_container.clear()
             with log_container:
-                shown = 0
-                for record in reversed(list(_log_buffer)):
-                    if shown >= 100:
-                        break
-                    record_order = _level_order.get(record["level"], 0)
-                    if record_order < min_order:
-                        continue
-                    if source and source not in record["name"].lower():
-                        continue
-
-                    level = record["level"]
-                    color = {
-                        "DEBUG": "text-gray-400",
-                        "INFO": "text-gray-700",
-                        "WARNING": "text-orange-600",
-                        "ERROR": "text-red-600",
-                        "CRITICAL": "text-red-800 font-bold",
-                    }.get(level, "text-gray-700")
-
-                    line = (
-                        f"{record['time']}  {level:8s}  "
-                        f"{record['name']:30s}  {record['message']}"
-                    )
-                    ui.label(line).classes(
-                        f"{color} whitespace-pre-wrap break-all"
-                    )
-                    shown += 1
+                for record in records:
+                    add_line(record)
 
-                if shown == 0:
+                empty[0] = not records
+                if empty[0]:
                     ui.label("No matching log entries.").classes(
                         "text-gray-400"
                     )
 
-        ui.timer(2.0, refresh_logs)
-        refresh_logs()
+        def on_events(events: list[dict]) -> None:
+            """Prepend newly pushed records that pass the current filters."""
+            update_buffer_label()
+            records = [
+                record
+                for e in events
+                if e.get("type") == "log_append"
+                for record in e["records"]
+                if matches(record)
+            ]
+            if not records:
+                return
+            if empty[0]:
+                log_container.clear()
+                empty[0] = False
+            with log_container:
+                for record in records[-100:]:
+                    add_line(record).move(target_index=0)
+            children = list(log_container)
+            for stale in children[100:]:
+                log_container.remove(stale)
+
+        level_filter.on_value_change(render_logs)
+        source_filter.on_value_change(render_logs)
+        subscribe_events(on_events, types=("log_append",))
+        update_buffer_label()
+        render_logs()
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
 import time
+from typing import Callable, Iterable
 
-from nicegui import ui
+from fastapi import Request, Response
+from nicegui import background_tasks, ui
 
 import hive_slack.admin as admin_state
 
+logger = logging.getLogger(__name__)
+
+# Tailwind classes shared by every admin page
+PAGE_COLUMN = "w-full max-w-4xl mx-auto p-4 gap-4"
+WIDE_PAGE_COLUMN = "w-full max-w-5xl mx-auto p-4 gap-4"
+PAGE_TITLE = "text-xl font-bold"
+SECTION_TITLE = "text-lg font-bold"
+# Pass as ``replace=`` when toggling a result label between ok and error
+RESULT_COLORS = "text-green-600 text-red-600"
+
 
 def admin_layout(title: str = "Dashboard") -> None:
     """Render the shared page header and navigation."""
@@ -35,9 +51,68 @@ def format_uptime(start_time: float) -> str:
     return f"{h}h {m}m"
 
 
+def format_log_message(msg: object, args: tuple | dict | None) -> str:
+    """Render a raw log message the way ``LogRecord.getMessage`` would."""
+    text = str(msg)
+    if args:
+        try:
+            text = text % args
+        except (TypeError, ValueError):
+            text = f"{text} {args!r}"
+    return text
+
+
 def status_badge(is_ok: bool, ok_text: str = "OK", fail_text: str = "Down") -> ui.badge:
     """Create a colored status badge."""
     if is_ok:
         return ui.badge(ok_text, color="green")
     else:
         return ui.badge(fail_text, color="red")
+
+
+def subscribe_events(
+    handler: Callable[[list[dict]], None], types: Iterable[str] | None = None
+) -> None:
+    """Deliver broadcast events to ``handler`` while the current client is connected.
+
+    Only events whose type is in ``types`` are delivered, if given.
+    Subscribes on (re)connect and unsubscribes on disconnect. Events that
+    queue up while the handler runs are delivered together as one batch,
+    so a burst of activity costs one UI update rather than many.
+    """
+    client = ui.context.client
+    active: list[tuple[asyncio.Queue[dict], asyncio.Task]] = []
+
+    async def pump(queue: asyncio.Queue[dict]) -> None:
+        while True:
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+            try:
+                handler(events)
+            except Exception:
+                logger.debug("Admin event handler failed", exc_info=True)
+
+    def on_connect() -> None:
+        queue = admin_state.manager.subscribe(types)
+        task = background_tasks.create(pump(queue), name="admin-events")
+        active.append((queue, task))
+
+    def on_disconnect() -> None:
+        while active:
+            queue, task = active.pop()
+            admin_state.manager.unsubscribe(queue)
+            task.cancel()
+
+    client.on_connect(on_connect)
+    client.on_disconnect(on_disconnect)
+
+
+def cached_json(request: Request, payload: object) -> Response:
+    """JSON response with an ETag; 304 when the client already has this body."""
+    body = json.dumps(payload, sort_keys=True).encode()
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
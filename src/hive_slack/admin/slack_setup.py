@@ -2,15 +2,94 @@
 
 from __future__ import annotations
 
+import asyncio
+import html
 import os
+from pathlib import Path
 
-from nicegui import ui
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from nicegui import app, ui
 
 import hive_slack.admin as admin_state
-from hive_slack.admin.shared import admin_layout
-from hive_slack.admin.auth import require_auth
+from hive_slack.admin.shared import (
+    PAGE_COLUMN,
+    PAGE_TITLE,
+    RESULT_COLORS,
+    admin_layout,
+    cached_json,
+)
+from hive_slack.admin.auth import is_authenticated, require_auth
 from hive_slack.setup import SLACK_MANIFEST, _generate_manifest_url
 
+# The manifest is static -- derive everything the page shows once at import
+_BOT_SCOPES: tuple[str, ...] = tuple(SLACK_MANIFEST["oauth_config"]["scopes"]["bot"])
+_BOT_EVENTS: tuple[str, ...] = tuple(
+    SLACK_MANIFEST["settings"]["event_subscriptions"]["bot_events"]
+)
+_MANIFEST_URL = _generate_manifest_url()
+
+
+def _badges_html(labels: tuple[str, ...], color: str) -> str:
+    """Render outline badges as static Quasar-styled HTML."""
+    return "".join(
+        f'<span class="q-badge q-badge--outline text-{color}">'
+        f"{html.escape(label)}</span>"
+        for label in labels
+    )
+
+
+# One static DOM fragment per list instead of a Vue component per badge
+_SCOPE_BADGES_HTML = _badges_html(_BOT_SCOPES, "blue")
+_EVENT_BADGES_HTML = _badges_html(_BOT_EVENTS, "green")
+
+
+def _write_env_tokens(env_path: Path, updated: dict[str, str]) -> bool:
+    """Update or append ``updated`` keys in a .env file. Blocking.
+
+    Comments, blank lines and ordering are preserved. Returns False (and
+    leaves the file untouched) when every value is already up to date.
+    """
+    lines = env_path.read_text().splitlines() if env_path.exists() else []
+
+    # Single pass: remember where each key is first defined
+    positions: dict[str, int] = {}
+    for i, line in enumerate(lines):
+        key, sep, _ = line.partition("=")
+        if sep:
+            positions.setdefault(key, i)
+
+    new_lines = list(lines)
+    for key, val in updated.items():
+        entry = f"{key}={val}"
+        if key in positions:
+            new_lines[positions[key]] = entry
+        else:
+            new_lines.append(entry)
+
+    if new_lines == lines:
+        return False
+    env_path.write_text("\n".join(new_lines) + "\n")
+    return True
+
+
+@app.get("/admin/api/slack.json")
+async def slack_api(request: Request) -> Response:
+    """Slack connection status and manifest summary, revalidated by ETag."""
+    if not is_authenticated():
+        return JSONResponse({"error": "unauthorized"}, status_code=401)
+    bot_user_id = getattr(admin_state._connector, "_bot_user_id", "") or ""
+    return cached_json(
+        request,
+        {
+            "connected": bool(bot_user_id),
+            "bot_user_id": bot_user_id,
+            "scopes": _BOT_SCOPES,
+            "events": _BOT_EVENTS,
+            "manifest_url": _MANIFEST_URL,
+        },
+    )
+
 
 @ui.page("/admin/slack")
 def slack_setup_page() -> None:
@@ -22,7 +101,7 @@ def slack_setup_page() -> None:
     connector = admin_state._connector
     config = admin_state._config  # noqa: F841
 
-    with ui.column().classes("w-full max-w-4xl mx-auto p-4 gap-4"):
+    with ui.column().classes(PAGE_COLUMN):
         is_connected = bool(getattr(connector, "_bot_user_id", ""))
 
         if is_connected:
@@ -33,7 +112,7 @@ def slack_setup_page() -> None:
 
 def _render_connected(connector) -> None:
     """Show connection status when already connected."""
-    ui.label("Slack Connection").classes("text-xl font-bold")
+    ui.label("Slack Connection").classes(PAGE_TITLE)
 
     with ui.card().classes("w-full"):
         bot_user_id = getattr(connector, "_bot_user_id", "unknown")
@@ -44,24 +123,16 @@ def _render_connected(connector) -> None:
         ui.separator()
 
         # Scopes
-        scopes = SLACK_MANIFEST["oauth_config"]["scopes"]["bot"]
-        ui.label(f"Bot Scopes ({len(scopes)}):").classes("font-bold mt-2")
-        with ui.row().classes("flex-wrap gap-1"):
-            for scope in scopes:
-                ui.badge(scope).props("color=blue outline")
+        ui.label(f"Bot Scopes ({len(_BOT_SCOPES)}):").classes("font-bold mt-2")
+        ui.html(_SCOPE_BADGES_HTML).classes("flex flex-wrap gap-1")
 
         ui.separator()
 
         # Events
-        events = SLACK_MANIFEST["settings"]["event_subscriptions"][
-            "bot_events"
-        ]
-        ui.label(f"Event Subscriptions ({len(events)}):").classes(
+        ui.label(f"Event Subscriptions ({len(_BOT_EVENTS)}):").classes(
             "font-bold mt-2"
         )
-        with ui.row().classes("flex-wrap gap-1"):
-            for event in events:
-                ui.badge(event).props("color=green outline")
+        ui.html(_EVENT_BADGES_HTML).classes("flex flex-wrap gap-1")
 
     # Actions
     with ui.row().classes("mt-4 gap-2"):
@@ -75,13 +146,13 @@ def _render_connected(connector) -> None:
                 result_label.text = f"Connected to '{team}' as @{user}"
                 result_label.classes(
                     "text-green-600",
-                    replace="text-green-600 text-red-600",
+                    replace=RESULT_COLORS,
                 )
             except Exception as e:
                 result_label.text = f"Error: {e}"
                 result_label.classes(
                     "text-red-600",
-                    replace="text-green-600 text-red-600",
+                    replace=RESULT_COLORS,
                 )
 
         ui.button("Test Connection", on_click=test_connection).props(
@@ -100,7 +171,7 @@ def _render_connected(connector) -> None:
 
 def _render_setup() -> None:
     """Show setup wizard when not yet connected."""
-    ui.label("Set Up Slack Connection").classes("text-xl font-bold")
+    ui.label("Set Up Slack Connection").classes(PAGE_TITLE)
 
     # Step 1: Create app
     with ui.card().classes("w-full"):
@@ -108,8 +179,7 @@ def _render_setup() -> None:
         ui.label(
             "Click the button below to create a pre-configured Slack app:"
         )
-        manifest_url = _generate_manifest_url()
-        ui.link("Create Slack App", manifest_url, new_tab=True).classes(
+        ui.link("Create Slack App", _MANIFEST_URL, new_tab=True).classes(
             "bg-blue-600 text-white px-4 py-2 rounded no-underline "
             "inline-block mt-2"
         )
@@ -146,47 +216,34 @@ def _render_setup() -> None:
                 result_label.text = f"Connected to '{team}' as @{user}"
                 result_label.classes(
                     "text-green-600",
-                    replace="text-green-600 text-red-600",
+                    replace=RESULT_COLORS,
                 )
             except Exception as e:
                 result_label.text = f"Error: {e}"
                 result_label.classes(
                     "text-red-600",
-                    replace="text-green-600 text-red-600",
+                    replace=RESULT_COLORS,
                 )
 
-        def save_tokens():
-            from pathlib import Path
-
-            env_path = Path(".env")
-            lines = []
-            if env_path.exists():
-                lines = env_path.read_text().splitlines()
-
-            # Update or append tokens
+        async def save_tokens():
             updated = {}
             if bot_input.value:
                 updated["SLACK_BOT_TOKEN"] = bot_input.value
             if app_input.value:
                 updated["SLACK_APP_TOKEN"] = app_input.value
 
-            new_lines = []
-            for line in lines:
-                key = line.split("=", 1)[0] if "=" in line else ""
-                if key in updated:
-                    new_lines.append(f"{key}={updated.pop(key)}")
-                else:
-                    new_lines.append(line)
-            for key, val in updated.items():
-                new_lines.append(f"{key}={val}")
-
-            env_path.write_text("\n".join(new_lines) + "\n")
+            # File I/O off the event loop so other admin clients stay responsive
+            changed = await asyncio.to_thread(
+                _write_env_tokens, Path(".env"), updated
+            )
             result_label.text = (
                 "Tokens saved to .env. Restart the service to apply."
+                if changed
+                else "Tokens in .env are already up to date."
             )
             result_label.classes(
                 "text-green-600",
-                replace="text-green-600 text-red-600",
+                replace=RESULT_COLORS,
             )
 
         with ui.row().classes("gap-2 mt-2"):
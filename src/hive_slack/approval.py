@@ -8,11 +8,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import uuid
+import secrets
+import sys
 from typing import Literal
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:  # async-timeout ships with aiohttp on 3.10
+    from async_timeout import timeout as _timeout
+
 logger = logging.getLogger(__name__)
 
+# Minimum gap between consecutive chat_update calls from one approval system
+_UPDATE_SPACING = 1.0
+
+# Every approval button's action_id is "approval_{correlation_id}_{option}"
+_ACTION_PREFIX = "approval_"
+
 
 class SlackApprovalSystem:
     """Interactive approval via Slack Block Kit buttons.
@@ -28,12 +40,40 @@ class SlackApprovalSystem:
     resolve_approval() when a button is clicked.
     """
 
+    # Button style for well-known options (matched case-insensitively)
+    _BUTTON_STYLES: dict[str, str] = {
+        "allow": "primary",
+        "yes": "primary",
+        "approve": "primary",
+        "deny": "danger",
+        "no": "danger",
+        "reject": "danger",
+    }
+
     def __init__(self, slack_client, channel: str, thread_ts: str = "") -> None:
         self._client = slack_client
         self._channel = channel
         self._thread_ts = thread_ts
-        # Pending approvals: correlation_id -> (event, result)
-        self._pending: dict[str, tuple[asyncio.Event, list[str]]] = {}
+        # Pending approvals: correlation_id -> future resolved with the choice
+        self._pending: dict[str, asyncio.Future[str]] = {}
+        # Message updates waiting to be sent: ts -> chat_update kwargs.
+        # A newer update for the same message replaces the queued one.
+        self._update_queue: dict[str, dict] = {}
+        self._update_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def _button(cls, correlation_id: str, option: str) -> dict:
+        """Build the Block Kit button for one approval option."""
+        button = {
+            "type": "button",
+            "text": {"type": "plain_text", "text": option},
+            "action_id": f"{_ACTION_PREFIX}{correlation_id}_{option}",
+            "value": option,
+        }
+        style = cls._BUTTON_STYLES.get(option.lower())
+        if style:
+            button["style"] = style
+        return button
 
     async def request_approval(
         self,
@@ -43,24 +83,10 @@ class SlackApprovalSystem:
         default: Literal["allow", "deny"],
     ) -> str:
         """Post approval buttons and wait for user response."""
-        correlation_id = str(uuid.uuid4())[:8]
+        correlation_id = secrets.token_hex(4)
 
         # Build Block Kit blocks
-        buttons = []
-        for option in options:
-            button: dict = {
-                "type": "button",
-                "text": {"type": "plain_text", "text": option},
-                "action_id": f"approval_{correlation_id}_{option}",
-                "value": option,
-            }
-            # Add style for well-known options
-            lower = option.lower()
-            if lower in ("allow", "yes", "approve"):
-                button["style"] = "primary"
-            elif lower in ("deny", "no", "reject"):
-                button["style"] = "danger"
-            buttons.append(button)
+        buttons = [self._button(correlation_id, option) for option in options]
 
         blocks = [
             {
@@ -74,9 +100,8 @@ class SlackApprovalSystem:
         ]
 
         # Post the approval message
-        event = asyncio.Event()
-        result_holder: list[str] = []
-        self._pending[correlation_id] = (event, result_holder)
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
 
         try:
             msg = await self._client.chat_postMessage(
@@ -89,8 +114,9 @@ class SlackApprovalSystem:
 
             # Wait for user response with timeout
             try:
-                await asyncio.wait_for(event.wait(), timeout=timeout)
-                selected = result_holder[0] if result_holder else default
+                # Context-manager timeout: no extra Task per approval
+                async with _timeout(timeout):
+                    selected = await future
             except asyncio.TimeoutError:
                 logger.info(
                     "Approval timed out after %.0fs, using default: %s",
@@ -99,44 +125,69 @@ class SlackApprovalSystem:
                 )
                 selected = default
 
-            # Update the message to show the result (remove buttons)
-            try:
-                result_text = f"{prompt}\n\n*Selected: {selected}*"
-                await self._client.chat_update(
-                    channel=self._channel,
-                    ts=msg_ts,
-                    text=result_text,
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": result_text},
-                        }
-                    ],
-                )
-            except Exception:
-                logger.debug("Failed to update approval message", exc_info=True)
+            # Update the message to show the result (remove buttons).
+            # Queued, not awaited -- the caller gets its answer immediately.
+            result_text = f"{prompt}\n\n*Selected: {selected}*"
+            self._queue_update(
+                msg_ts,
+                result_text,
+                [
+                    {
+                        "type": "section",
+                        "text": {"type": "mrkdwn", "text": result_text},
+                    }
+                ],
+            )
 
             return selected
 
         finally:
             self._pending.pop(correlation_id, None)
 
+    def _queue_update(self, ts: str, text: str, blocks: list[dict]) -> None:
+        """Schedule a chat_update for ``ts``, replacing any queued one."""
+        self._update_queue[ts] = {
+            "channel": self._channel,
+            "ts": ts,
+            "text": text,
+            "blocks": blocks,
+        }
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.create_task(self._drain_updates())
+
+    async def _drain_updates(self) -> None:
+        """Send queued updates, spaced out to stay under Slack rate limits."""
+        while self._update_queue:
+            ts = next(iter(self._update_queue))
+            kwargs = self._update_queue.pop(ts)
+            try:
+                await self._client.chat_update(**kwargs)
+            except Exception:
+                logger.debug("Failed to update approval message", exc_info=True)
+            if self._update_queue:
+                await asyncio.sleep(_UPDATE_SPACING)
+
+    async def flush_updates(self) -> None:
+        """Wait until all queued message updates have been sent."""
+        if self._update_task is not None:
+            await self._update_task
+
     def resolve_approval(self, action_id: str, value: str) -> bool:
         """Called by the connector when a block_actions event arrives.
 
         Returns True if this action was for a pending approval, False otherwise.
         """
-        # Parse correlation_id from action_id: "approval_{correlation_id}_{option}"
-        parts = action_id.split("_", 2)
-        if len(parts) < 2:
+        # Most block_actions belong to other features -- reject them cheaply
+        if not action_id.startswith(_ACTION_PREFIX):
             return False
 
-        correlation_id = parts[1]
-        if correlation_id not in self._pending:
+        correlation_id = action_id[len(_ACTION_PREFIX) :].partition("_")[0]
+        future = self._pending.get(correlation_id)
+        if future is None:
             return False
 
-        event, result_holder = self._pending[correlation_id]
-        result_holder.append(value)
-        event.set()
+        # First click wins; later clicks on the same prompt are ignored
+        if not future.done():
+            future.set_result(value)
         logger.info("Approval resolved: %s -> %s", correlation_id, value)
         return True
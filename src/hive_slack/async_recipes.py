@@ -24,6 +24,26 @@ from hive_slack.worker_manager import WorkerManager
 
 logger = logging.getLogger(__name__)
 
+# Tool result returned to the Director when a recipe is dispatched
+_STARTED_TEMPLATE = (
+    "Recipe '{label}' started in background ({task_id}). "
+    "You'll be notified when it completes or needs approval. "
+    "STOP. Do NOT call any more tools. Respond to the user NOW."
+)
+
+# Completion notifications carry at most this many characters of output
+_PREVIEW_LIMIT = 500
+
+
+def _preview(value: Any) -> str:
+    """Render ``value`` for a notification, capped at ``_PREVIEW_LIMIT``."""
+    # Strings are sliced as-is; only other types need a full str() first
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > _PREVIEW_LIMIT:
+        return text[:_PREVIEW_LIMIT] + "... [truncated]"
+    return text
+
+
 
 class AsyncRecipesTool:
     """Non-blocking proxy for the recipes tool.
@@ -75,12 +95,11 @@ class AsyncRecipesTool:
 
         # Long operations -- background dispatch
         self._counter += 1
-        recipe_path = input.get("recipe_path", "")
-        session_id = input.get("session_id", "")
-        label = recipe_path.rsplit("/", 1)[-1] if recipe_path else session_id
-        if not label:
-            label = f"recipe-{self._counter}"
         task_id = f"recipe-{self._counter}"
+        recipe_path = input.get("recipe_path", "")
+        label = (
+            recipe_path.rpartition("/")[2] or input.get("session_id", "") or task_id
+        )
 
         async def _run() -> None:
             try:
@@ -107,9 +126,7 @@ class AsyncRecipesTool:
                     )
                     self._notify_queue(msg)
                 else:
-                    output = str(output_raw) if output_raw is not None else str(result)
-                    if len(output) > 500:
-                        output = output[:500] + "... [truncated]"
+                    output = _preview(output_raw if output_raw is not None else result)
                     self._notify_queue(f"[RECIPE COMPLETE] {label}\n{output}")
             except asyncio.CancelledError:
                 self._notify_queue(f"[RECIPE CANCELLED] {label}")
@@ -122,9 +139,5 @@ class AsyncRecipesTool:
 
         return ToolResult(
             success=True,
-            output=(
-                f"Recipe '{label}' started in background ({task_id}). "
-                "You'll be notified when it completes or needs approval. "
-                "STOP. Do NOT call any more tools. Respond to the user NOW."
-            ),
+            output=_STARTED_TEMPLATE.format(label=label, task_id=task_id),
         )
@@ -10,8 +10,14 @@ from typing import Any, cast
 
 import yaml
 
+# libyaml's C parser when available -- much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class PersonaConfig:
     """How an instance appears in Slack."""
 
@@ -19,7 +25,7 @@ class PersonaConfig:
     emoji: str = ":robot_face:"
 
 
-@dataclass
+@dataclass(slots=True)
 class InstanceConfig:
     """Configuration for a single Amplifier instance."""
 
@@ -29,7 +35,7 @@ class InstanceConfig:
     persona: PersonaConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackConfig:
     """Slack connection configuration."""
 
@@ -37,13 +43,14 @@ class SlackConfig:
     bot_token: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HiveSlackConfig:
     """Top-level configuration for the Hive Slack connector."""
 
     instances: dict[str, InstanceConfig]
     default_instance: str
     slack: SlackConfig
+    max_workers: int = 4  # Dispatch workers allowed to run at once
 
     def get_instance(self, name: str) -> InstanceConfig:
         """Get instance config by name. Raises KeyError if not found."""
@@ -68,23 +75,27 @@ class HiveSlackConfig:
         Supports ${ENV_VAR} substitution in string values.
         Expands ~ in working_dir paths.
         """
-        with open(path) as f:
-            raw = yaml.safe_load(f)
-
-        resolved = cast(dict[str, Any], _substitute_env_vars(raw))
+        # Bytes in: the loader detects the encoding itself.
+        # ${ENV_VAR} references are resolved while parsing (see _EnvLoader).
+        with open(path, "rb") as f:
+            resolved = cast(dict[str, Any], yaml.load(f, Loader=_EnvLoader))
 
         # Parse instances — support both multi and single format
         instances: dict[str, InstanceConfig] = {}
         default_instance: str = ""
+        defaults = cast(dict[str, Any], resolved.get("defaults") or {})
 
         if "instances" in resolved:
             # Multi-instance format
             instances_data = cast(dict[str, Any], resolved["instances"])
-            for inst_name, inst_data in instances_data.items():
-                instances[inst_name] = _parse_instance(inst_name, inst_data)
-            # Default from config or first instance
-            defaults = cast(dict[str, Any], resolved.get("defaults", {}))
-            default_instance = defaults.get("instance", next(iter(instances)))
+            instances = {
+                inst_name: _parse_instance(inst_name, inst_data)
+                for inst_name, inst_data in instances_data.items()
+            }
+            # Default from config or first instance (YAML mappings keep order)
+            default_instance = defaults.get("instance") or next(
+                iter(instances_data), ""
+            )
         elif "instance" in resolved:
             # Legacy single-instance format
             inst_data = cast(dict[str, Any], resolved["instance"])
@@ -95,6 +106,10 @@ class HiveSlackConfig:
         if not instances:
             raise ValueError("Config must define at least one instance")
 
+        max_workers = int(defaults.get("max_workers", 4))
+        if max_workers < 1:
+            raise ValueError("defaults.max_workers must be at least 1")
+
         slack_data = cast(dict[str, Any], resolved["slack"])
         slack = SlackConfig(
             app_token=slack_data["app_token"],
@@ -105,6 +120,7 @@ class HiveSlackConfig:
             instances=instances,
             default_instance=default_instance,
             slack=slack,
+            max_workers=max_workers,
         )
 
 
@@ -130,23 +146,44 @@ def _parse_instance(name: str, data: dict[str, Any]) -> InstanceConfig:
 _ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
 
-def _substitute_env_vars(data: Any) -> Any:
-    """Recursively substitute ${ENV_VAR} references in string values."""
-    if isinstance(data, str):
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Resolve one ${ENV_VAR} match, failing loudly if it is unset."""
+    var_name = match.group(1)
+    value = os.environ.get(var_name)
+    if value is None:
+        raise ValueError(
+            f"Environment variable '{var_name}' is not set "
+            f"(referenced as ${{{var_name}}} in config)"
+        )
+    return value
+
+
+def _construct_str(loader: yaml.SafeLoader, node: yaml.ScalarNode) -> str:
+    """Build a YAML string, substituting ${ENV_VAR} references."""
+    value = loader.construct_scalar(node)
+    if "${" not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
-        def _replace(match):
-            var_name = match.group(1)
-            value = os.environ.get(var_name)
-            if value is None:
-                raise ValueError(
-                    f"Environment variable '{var_name}' is not set "
-                    f"(referenced as ${{{var_name}}} in config)"
+
+class _EnvLoader(_SafeLoader):
+    """Safe YAML loader that expands ${ENV_VAR} in string values during parsing.
+
+    Mapping keys are left as written, matching the old post-parse walk.
+    """
+
+    def construct_mapping(
+        self, node: yaml.MappingNode, deep: bool = False
+    ) -> dict[Any, Any]:
+        # Build string keys before the str constructor can see them; the
+        # base class then reuses these from constructed_objects.
+        self.flatten_mapping(node)
+        for key_node, _ in node.value:
+            if key_node.tag == "tag:yaml.org,2002:str":
+                self.constructed_objects.setdefault(
+                    key_node, self.construct_scalar(key_node)
                 )
-            return value
-
-        return _ENV_VAR_PATTERN.sub(_replace, data)
-    elif isinstance(data, dict):
-        return {k: _substitute_env_vars(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [_substitute_env_vars(item) for item in data]
-    return data
+        return super().construct_mapping(node, deep=deep)
+
+
+_EnvLoader.add_constructor("tag:yaml.org,2002:str", _construct_str)
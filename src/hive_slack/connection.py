@@ -8,15 +8,40 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
 
+import aiohttp
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 
+from hive_slack.admin import manager as admin_events
 from hive_slack.config import HiveSlackConfig
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:  # async-timeout ships with aiohttp on 3.10
+    from async_timeout import timeout as _timeout
+
 logger = logging.getLogger(__name__)
 
+_CLOCK_BOOTTIME = getattr(time, "CLOCK_BOOTTIME", None)
+
+# Skip the auth.test health check if an event arrived within this window --
+# the socket just proved itself alive.
+_ACTIVITY_WINDOW = 120.0
+
+
+def _suspend_aware_clock() -> float:
+    """A clock that keeps advancing while the OS is suspended.
+
+    Linux CLOCK_BOOTTIME counts suspended time but, unlike the wall clock,
+    is never stepped or slewed by NTP. Elsewhere fall back to wall time.
+    """
+    if _CLOCK_BOOTTIME is not None:
+        return time.clock_gettime(_CLOCK_BOOTTIME)
+    return time.time()
+
 
 class SlackConnection:
     """Manages the Slack Socket Mode connection lifecycle.
@@ -31,11 +56,21 @@ class SlackConnection:
         self._handler = AsyncSocketModeHandler(app, config.slack.app_token)
         self.bot_user_id: str = ""
         self.bot_id: str = ""
+        # True when start() created the web client's session (stop() closes it)
+        self._owns_session = False
 
         # Tracking fields for /status health reporting
         self._started_at: float | None = None
         self._last_health_check_at: float | None = None
         self._reconnect_count: int = 0
+        # Monotonic time of the last inbound Socket Mode event
+        self._last_event_at: float | None = None
+        app.use(self._track_activity)
+
+    async def _track_activity(self, next_) -> None:
+        """Global middleware: note that the event stream is alive."""
+        self._last_event_at = time.monotonic()
+        await next_()
 
     @property
     def started_at(self) -> float | None:
@@ -57,6 +92,16 @@ class SlackConnection:
         self._started_at = time.monotonic()
         logger.info("Starting Slack Socket Mode connection...")
 
+        # Without a session, slack_sdk opens (and TLS-handshakes) a fresh
+        # one for every Web API call. Share one pooled, keep-alive session.
+        client = self._app.client
+        if client.session is None:
+            client.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=client.timeout),
+                trust_env=client.trust_env_in_session,
+            )
+            self._owns_session = True
+
         # Get our own bot user ID for filtering @mentions in message handlers
         try:
             auth = await self._app.client.auth_test()
@@ -66,58 +111,109 @@ class SlackConnection:
             logger.warning("Could not determine bot user ID")
             self.bot_user_id = ""
 
+        admin_events.broadcast({"type": "connection", "state": "connected"})
         await self._handler.start_async()
 
     async def stop(self) -> None:
         """Stop the Socket Mode handler."""
         logger.info("Stopping Slack connection...")
         await self._handler.close_async()
+        admin_events.broadcast({"type": "connection", "state": "disconnected"})
+        # Only close the session start() created -- a caller-supplied one
+        # belongs to the caller
+        if self._owns_session:
+            client = self._app.client
+            await client.session.close()
+            client.session = None
+            self._owns_session = False
 
     async def reconnect(self) -> None:
         """Force a fresh Socket Mode connection.
 
-        Closes the current handler and starts a new one. Used by the
-        connection watchdog to recover from stale websockets after
-        OS suspend/resume (e.g. WSL2 sleep).
+        Swaps in a new websocket on the existing handler, keeping its
+        aiohttp session and message processor. Falls back to rebuilding
+        the handler if that fails. Used by the connection watchdog to
+        recover from stale websockets after OS suspend/resume (e.g. WSL2
+        sleep).
         """
         self._reconnect_count += 1
         logger.info("Forcing Socket Mode reconnection...")
+        try:
+            await self._handler.client.connect_to_new_endpoint(force=True)
+            logger.info("Reconnected to Slack successfully")
+            admin_events.broadcast({"type": "connection", "state": "reconnected"})
+            return
+        except Exception:
+            logger.warning(
+                "In-place reconnect failed -- rebuilding handler", exc_info=True
+            )
+
         try:
             await self._handler.close_async()
         except Exception:
             logger.warning("Error closing old handler", exc_info=True)
 
-        # Create a fresh handler (reuses the same app and its event registrations)
+        # A closed handler can't reconnect; create a fresh one (reuses the
+        # same app and its event registrations)
         self._handler = AsyncSocketModeHandler(self._app, self._config.slack.app_token)
         await self._handler.connect_async()
         logger.info("Reconnected to Slack successfully")
+        admin_events.broadcast({"type": "connection", "state": "reconnected"})
+
+    async def _health_check(self) -> None:
+        """Verify the connection via auth.test; reconnect if it fails."""
+        try:
+            async with _timeout(10.0):
+                await self._app.client.auth_test()
+            self._last_health_check_at = time.monotonic()
+        except Exception:
+            logger.warning(
+                "Health check (auth.test) failed -- forcing reconnect",
+                exc_info=True,
+            )
+            try:
+                await self.reconnect()
+            except Exception:
+                logger.exception("Reconnect failed after health check failure")
 
     async def run_watchdog(self, interval: float = 15.0) -> None:
-        """Detect OS suspend/resume via wall-clock time jumps and reconnect.
+        """Detect OS suspend/resume via clock jumps and reconnect.
 
-        Runs in a loop, sleeping for ``interval`` seconds. If wall-clock time
-        advanced by more than 2x the interval, we likely resumed from suspend
-        and the websocket is stale -- trigger a reconnect.
+        Runs in a loop, sleeping for ``interval`` seconds. The monotonic
+        clock stops while the OS is suspended; the suspend-aware clock
+        (CLOCK_BOOTTIME on Linux, wall time elsewhere) does not. If the
+        latter advanced by more than an extra interval, we likely resumed
+        from suspend and the websocket is stale -- trigger a reconnect.
 
-        Also periodically verifies the connection is alive via auth.test.
+        Also periodically verifies the connection is alive via auth.test,
+        unless events arrived recently.
         """
         last_check = time.monotonic()
-        last_wall = time.time()
+        last_boot = _suspend_aware_clock()
         health_check_counter = 0
 
+        # Wake on a fixed grid of deadlines so ticks don't drift by the
+        # time spent in the loop body (reconnects, health checks)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+
         while True:
-            await asyncio.sleep(interval)
+            deadline += interval
+            if deadline <= loop.time():
+                # Overran a whole tick -- restart the grid from now
+                deadline = loop.time() + interval
+            await asyncio.sleep(deadline - loop.time())
             now_mono = time.monotonic()
-            now_wall = time.time()
+            now_boot = _suspend_aware_clock()
             elapsed_mono = now_mono - last_check
-            elapsed_wall = now_wall - last_wall
+            elapsed_boot = now_boot - last_boot
 
-            # Detect time jump: wall clock advanced much more than monotonic
-            # sleep should allow. This happens when the OS was suspended.
-            if elapsed_wall > elapsed_mono + interval:
-                jump = elapsed_wall - elapsed_mono
+            # Detect time jump: the suspend-aware clock advanced much more
+            # than monotonic sleep should allow. The OS was suspended.
+            if elapsed_boot > elapsed_mono + interval:
+                jump = elapsed_boot - elapsed_mono
                 logger.warning(
-                    "Wall-clock jumped %.1fs beyond expected -- "
+                    "Clock jumped %.1fs beyond expected -- "
                     "OS likely suspended. Forcing reconnect.",
                     jump,
                 )
@@ -130,18 +226,14 @@ class SlackConnection:
             health_check_counter += 1
             if health_check_counter >= 8:
                 health_check_counter = 0
-                try:
-                    await asyncio.wait_for(self._app.client.auth_test(), timeout=10.0)
-                    self._last_health_check_at = time.monotonic()
-                except Exception:
-                    logger.warning(
-                        "Health check (auth.test) failed -- forcing reconnect",
-                        exc_info=True,
-                    )
-                    try:
-                        await self.reconnect()
-                    except Exception:
-                        logger.exception("Reconnect failed after health check failure")
+                if (
+                    self._last_event_at is not None
+                    and now_mono - self._last_event_at < _ACTIVITY_WINDOW
+                ):
+                    # Recent traffic is proof enough -- no API round-trip
+                    self._last_health_check_at = now_mono
+                else:
+                    await self._health_check()
 
             last_check = now_mono
-            last_wall = now_wall
+            last_boot = now_boot
@@ -21,6 +21,20 @@ logger = logging.getLogger(__name__)
 PHASE_TIMEOUT = 600  # seconds per verification phase
 
 
+def _read_optional(path: Path) -> str:
+    """Return the file's text, or an empty string if it doesn't exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return ""
+
+
+def _remove_files(*paths: Path) -> None:
+    """Delete each path, ignoring ones that are already gone."""
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
 class DispatchWorkerTool:
     """Dispatch a task to a background worker session.
 
@@ -30,6 +44,43 @@ class DispatchWorkerTool:
     posted to the channel -- The Director reports when asked.
     """
 
+    # Built once; returned as-is by input_schema on every agent step
+    _INPUT_SCHEMA: dict = {
+        "type": "object",
+        "properties": {
+            "task": {
+                "type": "string",
+                "description": (
+                    "Complete task description for the worker. Must be self-contained "
+                    "-- include all context the worker needs. The worker cannot see "
+                    "this conversation."
+                ),
+            },
+            "task_id": {
+                "type": "string",
+                "description": (
+                    "Short identifier for this task (e.g., 'deck-stain-research'). "
+                    "Used in TASKS.md tracking."
+                ),
+            },
+            "tier": {
+                "type": "string",
+                "description": (
+                    "Which tier this task was classified as "
+                    "(e.g., '2', '2+', '3'). For observability."
+                ),
+            },
+            "verification": {
+                "type": "boolean",
+                "description": (
+                    "Set to true for Tier 2 research tasks to enable "
+                    "two-pass verification (researcher + verifier chain)."
+                ),
+            },
+        },
+        "required": ["task", "task_id"],
+    }
+
     def __init__(
         self,
         session_manager,
@@ -62,41 +113,11 @@ class DispatchWorkerTool:
 
     @property
     def input_schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "task": {
-                    "type": "string",
-                    "description": (
-                        "Complete task description for the worker. Must be self-contained "
-                        "-- include all context the worker needs. The worker cannot see "
-                        "this conversation."
-                    ),
-                },
-                "task_id": {
-                    "type": "string",
-                    "description": (
-                        "Short identifier for this task (e.g., 'deck-stain-research'). "
-                        "Used in TASKS.md tracking."
-                    ),
-                },
-                "tier": {
-                    "type": "string",
-                    "description": (
-                        "Which tier this task was classified as "
-                        "(e.g., '2', '2+', '3'). For observability."
-                    ),
-                },
-                "verification": {
-                    "type": "boolean",
-                    "description": (
-                        "Set to true for Tier 2 research tasks to enable "
-                        "two-pass verification (researcher + verifier chain)."
-                    ),
-                },
-            },
-            "required": ["task", "task_id"],
-        }
+        return self._INPUT_SCHEMA
+
+    def _notify(self, text: str) -> None:
+        """Queue a worker report for the Director's next turn."""
+        self._manager.notify(self._instance_name, self._director_conversation_id, text)
 
     def _build_verifier_prompt(self, task_id: str) -> str:
         """Build the verifier worker's prompt with claim-checking instructions."""
@@ -129,132 +150,124 @@ class DispatchWorkerTool:
         outbox = self._working_dir / ".outbox"
         research_file = outbox / f"{task_id}-research.md"
         verification_file = outbox / f"{task_id}-verification.md"
+        # Bound once so both phases share the counter value, even if other
+        # dispatches bump it while this worker waits for a slot
+        conv_prefix = f"worker:{task_id}:{self._worker_counter}"
 
         try:
-            # Phase 1: Research
-            logger.info("Verified worker Phase 1 (research): %s", task_id)
-            research_conv = f"worker:{task_id}:{self._worker_counter}:research"
-            try:
-                await asyncio.wait_for(
-                    self._manager.execute(
-                        self._instance_name,
-                        research_conv,
-                        self._build_researcher_prompt(task, task_id),
-                    ),
-                    timeout=PHASE_TIMEOUT,
-                )
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                reason = "Research timed out"
-                await self._store.fail_task(task_id, reason)
-                self._manager.notify(
-                    self._instance_name,
-                    self._director_conversation_id,
-                    f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
+            async with self._workers.slot():
+                # Phase 1: Research
+                logger.info("Verified worker Phase 1 (research): %s", task_id)
+                research_conv = conv_prefix + ":research"
+                try:
+                    await asyncio.wait_for(
+                        self._manager.execute(
+                            self._instance_name,
+                            research_conv,
+                            self._build_researcher_prompt(task, task_id),
+                        ),
+                        timeout=PHASE_TIMEOUT,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError:
+                    reason = "Research timed out"
+                    await self._store.fail_task(task_id, reason)
+                    self._notify(
+                        f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
+                    )
+                    return
+                except Exception as e:
+                    reason = f"Research failed: {e}"
+                    await self._store.fail_task(task_id, reason)
+                    self._notify(
+                        f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
+                    )
+                    return
+
+                # Validate research output
+                research_content = await asyncio.to_thread(
+                    _read_optional, research_file
                 )
-                return
-            except Exception as e:
-                reason = f"Research failed: {e}"
-                await self._store.fail_task(task_id, reason)
-                self._manager.notify(
-                    self._instance_name,
-                    self._director_conversation_id,
-                    f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
+                if not research_content.strip():
+                    reason = (
+                        "Research worker completed "
+                        "but didn't produce structured output."
+                    )
+                    await self._store.fail_task(task_id, reason)
+                    self._notify(
+                        f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
+                    )
+                    return
+
+                # Phase 2: Verification
+                logger.info("Verified worker Phase 2 (verification): %s", task_id)
+                verify_conv = conv_prefix + ":verify"
+
+                try:
+                    await asyncio.wait_for(
+                        self._manager.execute(
+                            self._instance_name,
+                            verify_conv,
+                            self._build_verifier_prompt(task_id),
+                        ),
+                        timeout=PHASE_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Verified worker verification timed out: %s", task_id
+                    )
+                    await self._store.fail_task(task_id, "Verification timed out")
+                    self._notify(
+                        f'[WORKER REPORT] Task "{task_id}" partially complete.\n'
+                        "Research completed but verification failed.\n"
+                        f"Unverified results in .outbox/{task_id}-research.md",
+                    )
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.exception("Verified worker verification failed: %s", task_id)
+                    await self._store.fail_task(task_id, f"Verification failed: {e}")
+                    self._notify(
+                        f'[WORKER REPORT] Task "{task_id}" partially complete.\n'
+                        "Research completed but verification failed.\n"
+                        f"Unverified results in .outbox/{task_id}-research.md",
+                    )
+                    return
+
+                verification_content = await asyncio.to_thread(
+                    _read_optional, verification_file
                 )
-                return
 
-            # Validate research output
-            if not research_file.exists() or not research_file.read_text().strip():
-                reason = (
-                    "Research worker completed but didn't produce structured output."
-                )
-                await self._store.fail_task(task_id, reason)
-                self._manager.notify(
-                    self._instance_name,
-                    self._director_conversation_id,
-                    f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {reason}',
-                )
-                return
-
-            research_content = research_file.read_text()
-
-            # Phase 2: Verification
-            logger.info("Verified worker Phase 2 (verification): %s", task_id)
-            verify_conv = f"worker:{task_id}:{self._worker_counter}:verify"
-
-            try:
-                await asyncio.wait_for(
-                    self._manager.execute(
-                        self._instance_name,
-                        verify_conv,
-                        self._build_verifier_prompt(task_id),
-                    ),
-                    timeout=PHASE_TIMEOUT,
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Verified worker verification timed out: %s", task_id)
-                await self._store.fail_task(task_id, "Verification timed out")
-                self._manager.notify(
-                    self._instance_name,
-                    self._director_conversation_id,
-                    f'[WORKER REPORT] Task "{task_id}" partially complete.\n'
-                    "Research completed but verification failed.\n"
-                    f"Unverified results in .outbox/{task_id}-research.md",
-                )
-                return
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                logger.exception("Verified worker verification failed: %s", task_id)
-                await self._store.fail_task(task_id, f"Verification failed: {e}")
-                self._manager.notify(
-                    self._instance_name,
-                    self._director_conversation_id,
-                    f'[WORKER REPORT] Task "{task_id}" partially complete.\n'
-                    "Research completed but verification failed.\n"
-                    f"Unverified results in .outbox/{task_id}-research.md",
+                # Synthesis
+                summary = (
+                    f"Verified research complete. "
+                    f"Research: {research_content[:200]} "
+                    f"Verification: {verification_content[:200]}"
                 )
-                return
-
-            verification_content = (
-                verification_file.read_text() if verification_file.exists() else ""
-            )
+                if len(summary) > 500:
+                    summary = summary[:500] + "... [truncated]"
 
-            # Synthesis
-            summary = (
-                f"Verified research complete. "
-                f"Research: {research_content[:200]} "
-                f"Verification: {verification_content[:200]}"
-            )
-            if len(summary) > 500:
-                summary = summary[:500] + "... [truncated]"
+                await self._store.complete_task(task_id, summary)
+                logger.info("Verified worker completed: %s", task_id)
 
-            await self._store.complete_task(task_id, summary)
-            logger.info("Verified worker completed: %s", task_id)
-
-            self._manager.notify(
-                self._instance_name,
-                self._director_conversation_id,
-                f'[WORKER REPORT] Task "{task_id}" completed with verification.\n'
-                f"Research:\n{research_content}\n\n"
-                f"Verification:\n{verification_content}",
-            )
+                self._notify(
+                    f'[WORKER REPORT] Task "{task_id}" completed with verification.\n'
+                    f"Research:\n{research_content}\n\n"
+                    f"Verification:\n{verification_content}",
+                )
 
         except asyncio.CancelledError:
             logger.warning("Verified worker cancelled: %s", task_id)
             await self._store.fail_task(task_id, "cancelled")
-            self._manager.notify(
-                self._instance_name,
-                self._director_conversation_id,
+            self._notify(
                 f'[WORKER REPORT] Task "{task_id}" was cancelled.',
             )
 
         finally:
             # Cleanup intermediate files
-            for f in (research_file, verification_file):
-                if f.exists():
-                    f.unlink()
+            await asyncio.to_thread(_remove_files, research_file, verification_file)
 
     async def execute(self, input: dict[str, Any]) -> Any:
         """Dispatch a background worker and return immediately."""
@@ -288,7 +301,9 @@ class DispatchWorkerTool:
         else:
             coro = self._run_worker(task, task_id)
         worker_task = asyncio.create_task(coro, name=f"worker-{task_id}")
-        self._workers.register(task_id, worker_task, description=task[:100], tier=tier)
+        self._workers.register(
+            task_id, worker_task, description=task[:100], tier=tier, queued=True
+        )
 
         return ToolResult(
             success=True,
@@ -306,14 +321,16 @@ class DispatchWorkerTool:
         try:
             logger.info("Background worker starting: %s", task_id)
 
-            response = await self._manager.execute(
-                self._instance_name,
-                conversation_id,
-                task,
-            )
+            async with self._workers.slot():
+                response = await self._manager.execute(
+                    self._instance_name,
+                    conversation_id,
+                    task,
+                )
 
             # Write result to TASKS.md (truncate long responses for the summary)
             summary = response.strip()
+            del response  # Don't hold the full text across the awaits below
             if len(summary) > 500:
                 summary = (
                     summary[:500] + "... [truncated -- ask Director for full result]"
@@ -323,9 +340,7 @@ class DispatchWorkerTool:
             logger.info("Background worker completed: %s", task_id)
 
             # Notify Director of completion
-            self._manager.notify(
-                self._instance_name,
-                self._director_conversation_id,
+            self._notify(
                 f'[WORKER REPORT] Task "{task_id}" completed.\n'
                 f"Result: {summary}\n"
                 "Full details in TASKS.md.",
@@ -335,9 +350,7 @@ class DispatchWorkerTool:
             logger.warning("Background worker cancelled: %s", task_id)
             await self._store.fail_task(task_id, "cancelled")
 
-            self._manager.notify(
-                self._instance_name,
-                self._director_conversation_id,
+            self._notify(
                 f'[WORKER REPORT] Task "{task_id}" was cancelled.',
             )
 
@@ -346,8 +359,6 @@ class DispatchWorkerTool:
             await self._store.fail_task(task_id, str(e))
 
             # Notify Director of failure
-            self._manager.notify(
-                self._instance_name,
-                self._director_conversation_id,
+            self._notify(
                 f'[WORKER REPORT] Task "{task_id}" FAILED.\nError: {e}',
             )
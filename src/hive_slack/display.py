@@ -12,6 +12,12 @@ from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Emoji prefix per level; "info" messages are posted unprefixed
+_LEVEL_PREFIX = {"warning": "\u26a0\ufe0f ", "error": "\U0001f6a8 "}
+
+# Batched messages are split so no single post exceeds this many characters
+_MAX_POST_CHARS = 4000
+
 
 class SlackDisplaySystem:
     """Post hook messages to a Slack channel/thread.
@@ -24,6 +30,10 @@ class SlackDisplaySystem:
         self._channel = channel
         self._thread_ts = thread_ts
         self._background_tasks: set[asyncio.Task] = set()
+        # Messages waiting to be posted. Whatever piles up while a post is
+        # in flight goes out together in the next one.
+        self._buffer: list[str] = []
+        self._sender: asyncio.Task | None = None
 
     def show_message(
         self,
@@ -32,17 +42,34 @@ class SlackDisplaySystem:
         source: str = "hook",
     ) -> None:
         """Post a message to the Slack channel. Fire-and-forget."""
-        prefix = {"warning": "\u26a0\ufe0f ", "error": "\ud83d\udea8 "}.get(level, "")
-        text = f"{prefix}{message}"
+        prefix = _LEVEL_PREFIX.get(level)
+        text = prefix + message if prefix else message
 
         try:
             loop = asyncio.get_running_loop()
-            task = loop.create_task(self._post(text))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
         except RuntimeError:
             # No running event loop — just log
             logger.info("[display:%s] %s", level, message)
+            return
+
+        self._buffer.append(text)
+        if self._sender is None or self._sender.done():
+            self._sender = loop.create_task(self._drain())
+            self._background_tasks.add(self._sender)
+            self._sender.add_done_callback(self._background_tasks.discard)
+
+    async def _drain(self) -> None:
+        """Post buffered messages until the buffer is empty."""
+        while self._buffer:
+            batch, self._buffer = self._buffer, []
+            chunk = batch[0]
+            for text in batch[1:]:
+                if len(chunk) + 1 + len(text) > _MAX_POST_CHARS:
+                    await self._post(chunk)
+                    chunk = text
+                else:
+                    chunk = f"{chunk}\n{text}"
+            await self._post(chunk)
 
     async def _post(self, text: str) -> None:
         """Post to Slack. Best-effort — never raises."""
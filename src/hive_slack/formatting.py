@@ -7,13 +7,49 @@ routing directives.
 
 from __future__ import annotations
 
+import functools
+import math
+import random
 import re
 import time
 import logging
+from collections import OrderedDict
+from collections.abc import Collection
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every outgoing message, compiled once
+_TOPIC_DIRECTIVE_RE = re.compile(r"\[(\w+):(\w+)\]")
+_CODE_FENCE_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_HR_RE = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_PROTECTED_RE = re.compile(r"\x00PROTECTED(\d+)\x00")
+
+# Deletes the characters a table separator row (|---|:--|) is made of
+_TABLE_SEP_CHARS = str.maketrans("", "", "-:|")
+
+# Characters any markdown conversion needs; text without them is plain
+_MARKDOWN_CHARS = ("*", "`", "[", "#", "-", "_", "|")
+
+# Rendered messages up to this length are memoized; longer ones bypass the cache
+_MARKDOWN_CACHE_MAX_CHARS = 10_000
+
+# Separators: horizontal rules in replies, and the todo status underline
+_HR_LINE = "\n" + "\u2501" * 31 + "\n"
+_DIM_LINE = "\u2500" * 39
+
+# XFetch early-refresh aggressiveness (1.0 is the standard setting)
+_XFETCH_BETA = 1.0
+
+# Accepted values for the fixed-choice topic directives
+_TOPIC_MODES = frozenset({"roundtable", "open"})
+_TOPIC_THREADS = frozenset({"off"})
+
 
 @dataclass
 class ChannelConfig:
@@ -32,7 +68,7 @@ class ChannelConfig:
     name: str = ""  # Channel name for context enrichment
 
 
-def _parse_channel_topic(topic: str, known_instances: list[str]) -> ChannelConfig:
+def _parse_channel_topic(topic: str, known_instances: Collection[str]) -> ChannelConfig:
     """Parse [key:value] routing directives from a channel topic.
 
     Supports:
@@ -42,45 +78,75 @@ def _parse_channel_topic(topic: str, known_instances: list[str]) -> ChannelConfi
 
     Unknown instance names in directives are ignored.
     """
-    config = ChannelConfig()
-
-    for match in re.finditer(r"\[(\w+):(\w+)\]", topic):
-        key = match.group(1).lower()
-        value = match.group(2).lower()
+    # Most topics are plain prose with no directives at all
+    if "[" not in topic or ":" not in topic:
+        return ChannelConfig()
+
+    # Valid values per directive key; the last valid directive for a key wins
+    allowed = {
+        "instance": known_instances,
+        "mode": _TOPIC_MODES,
+        "default": known_instances,
+        "threads": _TOPIC_THREADS,
+    }
+    directives: dict[str, str] = {}
 
-        if key == "instance" and value in known_instances:
-            config.instance = value
-        elif key == "mode" and value in ("roundtable", "open"):
-            config.mode = value
-        elif key == "default" and value in known_instances:
-            config.default = value
-        elif key == "threads" and value in ("off",):
-            config.threads = value
+    # Lowercase once up front rather than each key and value per match
+    for match in _TOPIC_DIRECTIVE_RE.finditer(topic.lower()):
+        key, value = match.groups()
+        if key in allowed and value in allowed[key]:
+            directives[key] = value
 
-    return config
+    return ChannelConfig(**directives)
 
 
 class ChannelConfigCache:
     """Caches parsed channel routing config from Slack channel topics."""
 
-    def __init__(self, slack_client, instance_names: list[str], ttl: int = 60) -> None:
+    def __init__(
+        self,
+        slack_client,
+        instance_names: list[str],
+        ttl: int = 60,
+        max_size: int = 512,
+        negative_ttl: int = 10,
+    ) -> None:
         self._client = slack_client
-        self._instance_names = instance_names
-        self._cache: dict[str, ChannelConfig] = {}
+        # A set: every topic directive is checked against it
+        self._instance_names = frozenset(instance_names)
+        # LRU order: least recently used channel first, evicted past max_size
+        self._cache: OrderedDict[str, ChannelConfig] = OrderedDict()
+        self._max_size = max_size
+        # Monotonic fetch time and Slack API latency per channel
         self._timestamps: dict[str, float] = {}
+        self._fetch_durations: dict[str, float] = {}
         self._ttl = ttl
+        # Failed lookups are retried sooner than successful ones expire
+        self._negative_ttl = min(negative_ttl, ttl)
+
+    def _is_stale(self, channel_id: str, now: float) -> bool:
+        """Whether this caller should refresh the entry (XFetch).
+
+        Callers refresh early at random, more often close to expiry and
+        for channels that were slow to fetch, so entries cached together
+        don't all hit the Slack API in the same instant.
+        """
+        expiry = self._timestamps.get(channel_id, 0.0) + self._ttl
+        delta = self._fetch_durations.get(channel_id, 0.0)
+        # 1 - random() is in (0, 1], so the log is finite and <= 0
+        jitter = -delta * _XFETCH_BETA * math.log(1.0 - random.random())
+        return now + jitter >= expiry
 
     async def get(self, channel_id: str) -> ChannelConfig:
         """Get routing config for a channel, parsed from its topic. Cached."""
-        now = time.time()
-        if (
-            channel_id in self._cache
-            and now - self._timestamps.get(channel_id, 0) < self._ttl
-        ):
+        now = time.monotonic()
+        if channel_id in self._cache and not self._is_stale(channel_id, now):
+            self._cache.move_to_end(channel_id)
             return self._cache[channel_id]
 
         # Fetch channel info from Slack API
         channel_name = ""
+        failed = False
         try:
             result = await self._client.conversations_info(channel=channel_id)
             channel_data = result.get("channel", {})
@@ -89,15 +155,72 @@ class ChannelConfigCache:
         except Exception:
             logger.warning("Could not fetch channel info for %s", channel_id)
             topic = ""
+            failed = True
 
-        config = _parse_channel_topic(topic, self._instance_names)
-        config.name = channel_name
-        self._cache[channel_id] = config
-        self._timestamps[channel_id] = now
+        fetched = time.monotonic()
+        previous = self._cache.get(channel_id)
+        if failed and previous is not None:
+            # Keep routing with the last good config until the retry
+            config = previous
+        else:
+            config = _parse_channel_topic(topic, self._instance_names)
+            config.name = channel_name
+        # Back-date failures so they expire after negative_ttl, not ttl
+        stored_at = fetched - (self._ttl - self._negative_ttl if failed else 0)
+        self._store(channel_id, config, stored_at, fetched - now)
 
         logger.debug("Channel %s config: %s (topic: %s)", channel_id, config, topic)
         return config
 
+    async def prewarm(self) -> None:
+        """Seed the cache with every channel the bot is a member of.
+
+        One paginated users.conversations listing replaces the
+        conversations.info round-trip on the first message per channel.
+        Channels already fetched by ``get()`` are left alone.
+        """
+        cursor = None
+        seeded = 0
+        try:
+            while len(self._cache) < self._max_size:
+                started = time.monotonic()
+                result = await self._client.users_conversations(
+                    types="public_channel,private_channel",
+                    exclude_archived=True,
+                    limit=200,
+                    cursor=cursor,
+                )
+                fetched = time.monotonic()
+                for channel in result.get("channels", []):
+                    channel_id = channel.get("id", "")
+                    if not channel_id or channel_id in self._cache:
+                        continue
+                    topic = channel.get("topic", {}).get("value", "")
+                    config = _parse_channel_topic(topic, self._instance_names)
+                    config.name = channel.get("name", "")
+                    # The page latency stands in for the per-channel fetch time
+                    self._store(channel_id, config, fetched, fetched - started)
+                    seeded += 1
+                cursor = result.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except Exception:
+            logger.warning("Could not prewarm channel configs", exc_info=True)
+        logger.info("Prewarmed routing config for %d channel(s)", seeded)
+
+    def _store(
+        self, channel_id: str, config: ChannelConfig, stored_at: float, duration: float
+    ) -> None:
+        """Insert or refresh an entry as most recently used, evicting past max_size."""
+        self._cache[channel_id] = config
+        self._cache.move_to_end(channel_id)
+        self._timestamps[channel_id] = stored_at
+        self._fetch_durations[channel_id] = duration
+        while len(self._cache) > self._max_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self._timestamps.pop(evicted, None)
+            self._fetch_durations.pop(evicted, None)
+
 
 def markdown_to_slack(text: str) -> str:
     """Convert standard markdown to Slack's mrkdwn format.
@@ -111,51 +234,73 @@ def markdown_to_slack(text: str) -> str:
 
     Order of operations matters: tables and code blocks are extracted
     first so their content isn't mangled by inline formatting conversions.
+
+    Results are cached: identical messages (retries, fixed headers) are
+    converted once. Very long messages skip the cache.
     """
+    # Plain status lines have nothing to convert -- skip every regex pass
+    if "\n\n\n" not in text and not any(c in text for c in _MARKDOWN_CHARS):
+        return text.strip()
+    if len(text) > _MARKDOWN_CACHE_MAX_CHARS:
+        return _markdown_to_slack_impl(text)
+    return _markdown_to_slack_cached(text)
+
+
+def _markdown_to_slack_impl(text: str) -> str:
+    """Uncached conversion behind ``markdown_to_slack``."""
     protected: list[str] = []
 
     def _protect(content: str) -> str:
         protected.append(content)
         return f"\x00PROTECTED{len(protected) - 1}\x00"
 
+    def _restore(match: re.Match[str]) -> str:
+        index = int(match.group(1))
+        return protected[index] if index < len(protected) else match.group(0)
+
     # 1. Protect existing code blocks
-    text = re.sub(r"```[\s\S]*?```", lambda m: _protect(m.group(0)), text)
+    text = _CODE_FENCE_RE.sub(lambda m: _protect(m.group(0)), text)
 
     # 2. Protect inline code
-    text = re.sub(r"`[^`]+`", lambda m: _protect(m.group(0)), text)
+    text = _INLINE_CODE_RE.sub(lambda m: _protect(m.group(0)), text)
 
     # 3. Extract and convert tables BEFORE inline formatting
-    #    (so **bold** in cells becomes plain text in the code block)
-    text = _convert_tables(text, _protect)
+    #    (so **bold** in cells becomes plain text in the code block).
+    #    No "|" means no table rows -- skip the per-line scan entirely.
+    if "|" in text:
+        text = _convert_tables(text, _protect)
 
     # 4. Now safe to do inline formatting (tables are protected)
     # Bold: **text** → *text*
-    text = re.sub(r"\*\*(.+?)\*\*", r"*\1*", text)
+    text = _BOLD_RE.sub(r"*\1*", text)
 
     # Links: [text](url) → <url|text>
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<\2|\1>", text)
+    text = _LINK_RE.sub(r"<\2|\1>", text)
 
     # Headings: # Heading → *Heading*
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"*\1*", text, flags=re.MULTILINE)
+    if "#" in text:
+        text = _HEADING_RE.sub(r"*\1*", text)
 
     # Horizontal rules: ---, ***, ___ → visual separator with spacing
-    text = re.sub(
-        r"^[-*_]{3,}\s*$",
-        "\n\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\u2501\n",
-        text,
-        flags=re.MULTILINE,
-    )
+    text = _HR_RE.sub(_HR_LINE, text)
 
     # 5. Restore all protected content
-    for i, content in enumerate(protected):
-        text = text.replace(f"\x00PROTECTED{i}\x00", content)
+    #    (one pass, however many placeholders there are)
+    if protected:
+        text = _PROTECTED_RE.sub(_restore, text)
 
     # Clean up excessive blank lines (3+ → 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\n\n\n" in text:
+        text = _BLANK_LINES_RE.sub("\n\n", text)
 
     return text.strip()
 
 
+_markdown_to_slack_cached = functools.lru_cache(maxsize=1024)(
+    _markdown_to_slack_impl
+)
+
+
 def _convert_tables(text: str, protect_fn) -> str:
     """Find markdown tables and convert to a list format that wraps gracefully.
 
@@ -168,14 +313,14 @@ def _convert_tables(text: str, protect_fn) -> str:
     in_table = False
 
     for line in lines:
-        is_table_row = bool(re.match(r"^\s*\|.*\|\s*$", line))
-        is_separator = bool(re.match(r"^\s*\|[-:\s|]+\|\s*$", line))
-
-        if is_table_row:
+        # A table row is "|...|" once surrounding whitespace is stripped
+        row = line.strip()
+        if len(row) >= 2 and row[0] == "|" and row[-1] == "|":
             if not in_table:
                 in_table = True
                 table_lines = []
-            if not is_separator:
+            # Separator rows hold only "-", ":", "|" and whitespace
+            if len(row) == 2 or row[1:-1].translate(_TABLE_SEP_CHARS).strip():
                 table_lines.append(line)
         else:
             if in_table:
@@ -192,7 +337,9 @@ def _convert_tables(text: str, protect_fn) -> str:
 
 def _clean_cell(text: str) -> str:
     """Strip markdown bold from cell text."""
-    return re.sub(r"\*\*(.+?)\*\*", r"\1", text).strip()
+    if "**" not in text:
+        return text.strip()
+    return _BOLD_RE.sub(r"\1", text).strip()
 
 
 def _render_table_as_list(rows: list[str]) -> str:
@@ -231,37 +378,41 @@ def _render_table_as_list(rows: list[str]) -> str:
         return "\n".join(lines)
 
     # Multi-column: use header names as labels per data row
+    labels = [_clean_cell(h) for h in headers[1:]]
     lines = []
     for row in data_rows:
         row_label = _clean_cell(row[0]) if row else ""
         lines.append(f"*{row_label}*")
-        for col_idx in range(1, len(headers)):
-            header = _clean_cell(headers[col_idx]) if col_idx < len(headers) else ""
-            value = row[col_idx].strip() if col_idx < len(row) else ""
-            lines.append(f"  {header}: {value}")
+        lines.extend(
+            f"  {label}: {row[col_idx].strip() if col_idx < len(row) else ''}"
+            for col_idx, label in enumerate(labels, 1)
+        )
         lines.append("")
     return "\n".join(lines).rstrip()
 
 
+# Status-line wording per tool module name
+_FRIENDLY_TOOL_NAMES: dict[str, str] = {
+    "read_file": "Reading files",
+    "write_file": "Writing files",
+    "edit_file": "Editing files",
+    "bash": "Running command",
+    "glob": "Searching files",
+    "grep": "Searching content",
+    "web_search": "Searching the web",
+    "web_fetch": "Fetching web page",
+    "delegate": "Delegating to agent",
+    "todo": "Managing tasks",
+    "LSP": "Analyzing code",
+    "python_check": "Checking code quality",
+    "load_skill": "Loading knowledge",
+    "recipes": "Running recipe",
+}
+
+
 def _friendly_tool_name(tool_name: str) -> str:
     """Convert tool module names to human-friendly descriptions."""
-    friendly = {
-        "read_file": "Reading files",
-        "write_file": "Writing files",
-        "edit_file": "Editing files",
-        "bash": "Running command",
-        "glob": "Searching files",
-        "grep": "Searching content",
-        "web_search": "Searching the web",
-        "web_fetch": "Fetching web page",
-        "delegate": "Delegating to agent",
-        "todo": "Managing tasks",
-        "LSP": "Analyzing code",
-        "python_check": "Checking code quality",
-        "load_skill": "Loading knowledge",
-        "recipes": "Running recipe",
-    }
-    return friendly.get(tool_name, f"Working ({tool_name})")
+    return _FRIENDLY_TOOL_NAMES.get(tool_name, f"Working ({tool_name})")
 
 
 def _format_duration(seconds: float) -> str:
@@ -283,37 +434,39 @@ def _render_todo_status(
     queued: int,
 ) -> str:
     """Render plan-mode status message with todo list."""
-    lines = []
-
     # Header
     header = f"\u2699\ufe0f {instance_name}"
     if duration_str:
         header += f" \u00b7 {duration_str}"
-    lines.append(header)
-    lines.append(
-        "\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500"
-    )
-
-    # Categorize todos
-    completed = [t for t in todos if t.get("status") == "completed"]
-    in_progress = [t for t in todos if t.get("status") == "in_progress"]
-    pending = [t for t in todos if t.get("status") == "pending"]
+    lines = [header, _DIM_LINE]
+
+    # Categorize todos in a single pass
+    completed: list[dict] = []
+    in_progress: list[dict] = []
+    pending: list[dict] = []
+    by_status = {
+        "completed": completed,
+        "in_progress": in_progress,
+        "pending": pending,
+    }
+    for t in todos:
+        bucket = by_status.get(t.get("status"))
+        if bucket is not None:
+            bucket.append(t)
 
     # Completed: collapse if more than 2
     if len(completed) > 2:
         lines.append(f"\u2705  {len(completed)} completed")
     else:
-        for t in completed:
-            lines.append(f"\u2705  {t.get('content', '')}")
+        lines.extend(f"\u2705  {t.get('content', '')}" for t in completed)
 
     # In-progress: always show with activeForm
-    for t in in_progress:
-        active = t.get("activeForm", t.get("content", ""))
-        lines.append(f"\u25b8  *{active}*")
+    lines.extend(
+        f"\u25b8  *{t.get('activeForm', t.get('content', ''))}*" for t in in_progress
+    )
 
     # Pending: show first 2, collapse rest
-    for t in pending[:2]:
-        lines.append(f"\u25cb  {t.get('content', '')}")
+    lines.extend(f"\u25cb  {t.get('content', '')}" for t in pending[:2])
     if len(pending) > 2:
         lines.append(f"    +{len(pending) - 2} more")
 
@@ -404,9 +557,10 @@ def _format_status(status: dict) -> str:
             task_id = w.get("task_id", "unknown")
             tier = w.get("tier", "")
             elapsed = w.get("elapsed_seconds", 0)
-            elapsed_str = _format_duration(elapsed)
-            if not elapsed_str:
-                elapsed_str = f"{int(elapsed)}s"
+            if w.get("queued"):
+                elapsed_str = "queued"
+            else:
+                elapsed_str = _format_duration(elapsed) or f"{int(elapsed)}s"
             if tier:
                 lines.append(f"  - {task_id} (Tier {tier}, {elapsed_str})")
             else:
@@ -9,6 +9,7 @@ import secrets
 import signal
 import sys
 from pathlib import Path
+from typing import Any, Coroutine
 
 from hive_slack.config import HiveSlackConfig
 from hive_slack.service import InProcessSessionManager
@@ -27,8 +28,18 @@ def _nicegui_available() -> bool:
         return False
 
 
-async def run(config_path: str) -> None:
-    """Load config, start service, connect to Slack, run until interrupted."""
+def _run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run ``main`` on uvloop if it is installed, else the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return
+    uvloop.run(main)
+
+
+def _setup_logging() -> None:
+    """Configure root logging at the level named by $LOG_LEVEL (default INFO)."""
     logging.basicConfig(
         level=getattr(
             logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO
@@ -37,6 +48,11 @@ async def run(config_path: str) -> None:
         datefmt="%H:%M:%S",
     )
 
+
+async def _start_bot(
+    config_path: str,
+) -> tuple[HiveSlackConfig, InProcessSessionManager, SlackConnector]:
+    """Load config, start the service and build the (unstarted) connector."""
     logger.info("Loading config from %s", config_path)
     config = HiveSlackConfig.from_yaml(config_path)
 
@@ -56,8 +72,16 @@ async def run(config_path: str) -> None:
 
     # Create the Slack connector
     connector = SlackConnector(config, service)
+    instance_names = ", ".join(
+        f"{inst.persona.name} {inst.persona.emoji}"
+        for inst in config.instances.values()
+    )
+    logger.info("Connecting to Slack with instances: %s", instance_names)
+    return config, service, connector
 
-    # Graceful shutdown
+
+async def _install_shutdown_event() -> asyncio.Event:
+    """Return an event that SIGINT/SIGTERM set on the running loop."""
     stop_event = asyncio.Event()
     loop = asyncio.get_running_loop()
 
@@ -67,27 +91,44 @@ async def run(config_path: str) -> None:
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, handle_signal)
+    return stop_event
+
+
+async def _stop_tasks(tasks: list[asyncio.Task[Any]]) -> None:
+    """Cancel ``tasks`` and wait until they have all finished."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
-    instance_names = ", ".join(
-        f"{inst.persona.name} {inst.persona.emoji}"
-        for inst in config.instances.values()
-    )
-    logger.info("Connecting to Slack with instances: %s", instance_names)
 
-    connector_task: asyncio.Task[None] | None = None
-    watchdog_task: asyncio.Task[None] | None = None
+async def run(config_path: str) -> None:
+    """Load config, start service, connect to Slack, run until interrupted."""
+    _setup_logging()
+    _, service, connector = await _start_bot(config_path)
+
+    # Graceful shutdown
+    stop_event = await _install_shutdown_event()
+    stop_task = asyncio.create_task(stop_event.wait())
+    bot_tasks = [
+        asyncio.create_task(connector.start()),
+        asyncio.create_task(connector.run_watchdog()),
+    ]
     try:
-        connector_task = asyncio.create_task(connector.start())
-        watchdog_task = asyncio.create_task(connector.run_watchdog())
-        await stop_event.wait()
+        # As in a TaskGroup: a signal or a crashed bot task ends the run
+        done, _ = await asyncio.wait(
+            [stop_task, *bot_tasks], return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            if task is not stop_task and task.exception() is not None:
+                logger.error(
+                    "Slack connector stopped unexpectedly", exc_info=task.exception()
+                )
     except Exception:
         logger.exception("Unexpected error")
     finally:
         logger.info("Shutting down...")
-        if watchdog_task is not None:
-            watchdog_task.cancel()
-        if connector_task is not None:
-            connector_task.cancel()
+        # Let the cancellations finish so no task is left pending at exit
+        await _stop_tasks([stop_task, *bot_tasks])
         await connector.stop()
         await service.stop()
         logger.info("Shutdown complete")
@@ -106,38 +147,8 @@ def run_with_admin(config_path: str) -> None:
     async def startup():
         nonlocal config, service, connector
 
-        logging.basicConfig(
-            level=getattr(
-                logging,
-                os.environ.get("LOG_LEVEL", "INFO").upper(),
-                logging.INFO,
-            ),
-            format="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%H:%M:%S",
-        )
-
-        config = HiveSlackConfig.from_yaml(config_path)
-
-        # Start service
-        service = InProcessSessionManager(config)
-        await service.start()
-
-        for name, inst in config.instances.items():
-            logger.info(
-                "Instance '%s' ready (%s, bundle=%s)",
-                name,
-                inst.persona.name,
-                inst.bundle,
-            )
-        logger.info("Default instance: %s", config.default_instance)
-
-        # Start connector
-        connector = SlackConnector(config, service)
-        instance_names = ", ".join(
-            f"{inst.persona.name} {inst.persona.emoji}"
-            for inst in config.instances.values()
-        )
-        logger.info("Connecting to Slack with instances: %s", instance_names)
+        _setup_logging()
+        config, service, connector = await _start_bot(config_path)
 
         # Initialize admin UI
         from hive_slack.admin import create_admin_app
@@ -145,19 +156,15 @@ def run_with_admin(config_path: str) -> None:
         create_admin_app(service, connector, config)
 
         # Start connector and watchdog as background tasks
-        nonlocal connector_task, watchdog_task
-        connector_task = asyncio.create_task(connector.start())
-        watchdog_task = asyncio.create_task(connector.run_watchdog())
+        bot_tasks.append(asyncio.create_task(connector.start()))
+        bot_tasks.append(asyncio.create_task(connector.run_watchdog()))
 
-    connector_task: asyncio.Task[None] | None = None
-    watchdog_task: asyncio.Task[None] | None = None
+    bot_tasks: list[asyncio.Task[None]] = []
 
+    # Signals are left to uvicorn, which runs this hook on SIGINT/SIGTERM
     @nicegui_app.on_shutdown
     async def shutdown():
-        if watchdog_task is not None:
-            watchdog_task.cancel()
-        if connector_task is not None:
-            connector_task.cancel()
+        await _stop_tasks(bot_tasks)
         if connector:
             await connector.stop()
         if service:
@@ -200,7 +207,7 @@ def cli() -> None:
         if not no_admin and _nicegui_available():
             run_with_admin(config_path)
         else:
-            asyncio.run(run(config_path))
+            _run_event_loop(run(config_path))
         return
 
     command = args[0]
@@ -23,28 +23,34 @@ USERS_DIR = Path("~/.amplifier/hive/users").expanduser()
 
 # --- Message constants ---
 
-THREAD_FOOTER = "\n\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\n_New thread, fresh start \u2014 I don't have context from your other conversations._"
+# Rule between the bot's answer and an onboarding note
+_SEPARATOR = "\n" + "\u2500" * 31 + "\n"
+
+THREAD_FOOTER = (
+    _SEPARATOR
+    + "_New thread, fresh start \u2014 I don't have context from your other conversations._"
+)
 
 CROSS_THREAD_NOTE = (
-    "\n\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\n"
-    "_Heads up: each thread is its own conversation, so I don't have context "
+    _SEPARATOR
+    + "_Heads up: each thread is its own conversation, so I don't have context "
     "from other threads. If you're referring to something specific, paste it "
     "here and I'll pick right up._"
 )
 
 TIP_REGENERATE = (
-    "\n\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\n"
-    "_Tip: React with :arrows_counterclockwise: on any of my responses to get a fresh take._"
+    _SEPARATOR
+    + "_Tip: React with :arrows_counterclockwise: on any of my responses to get a fresh take._"
 )
 
 TIP_FILE_UPLOAD = (
-    "\n\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\n"
-    "_Tip: You can drop files into the thread \u2014 code, images, docs. I'll read them._"
+    _SEPARATOR
+    + "_Tip: You can drop files into the thread \u2014 code, images, docs. I'll read them._"
 )
 
 TIP_MID_EXECUTION = (
-    "\n\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\n"
-    "_Tip: When you see the :hourglass_flowing_sand:, you can send follow-up "
+    _SEPARATOR
+    + "_Tip: When you see the :hourglass_flowing_sand:, you can send follow-up "
     "messages to steer what I'm doing._"
 )
 
@@ -92,9 +98,13 @@ class OnboardingState:
 class UserOnboarding:
     """Per-user onboarding manager. Load once per message, save after response."""
 
-    def __init__(self, user_id: str, state: OnboardingState) -> None:
+    def __init__(
+        self, user_id: str, state: OnboardingState, dirty: bool = False
+    ) -> None:
         self._user_id = user_id
         self._state = state
+        # Set when state changes; save() skips the disk write otherwise
+        self._dirty = dirty
 
     @classmethod
     async def load(cls, user_id: str) -> UserOnboarding:
@@ -117,6 +127,7 @@ class UserOnboarding:
         return cls(
             user_id,
             OnboardingState(user_id=user_id, first_seen=_now()),
+            dirty=True,
         )
 
     @property
@@ -127,6 +138,7 @@ class UserOnboarding:
     def mark_welcomed(self) -> None:
         """Mark the user as having received the welcome DM."""
         self._state.welcomed = True
+        self._dirty = True
 
     def record_thread(self, conversation_id: str) -> bool:
         """Record a thread interaction. Returns True if this is a NEW thread."""
@@ -134,6 +146,7 @@ class UserOnboarding:
             return False
         self._state.recent_threads.append(conversation_id)
         self._state.threads_started += 1
+        self._dirty = True
         # FIFO cap
         if len(self._state.recent_threads) > 50:
             self._state.recent_threads = self._state.recent_threads[-50:]
@@ -165,6 +178,7 @@ class UserOnboarding:
         # Priority 1: Cross-thread confusion (reactive, capped at 3)
         if has_cross_thread_ref and is_new_thread and s.cross_thread_notes_shown < 3:
             s.cross_thread_notes_shown += 1
+            self._dirty = True
             return CROSS_THREAD_NOTE
 
         # Priority 2: Thread footer (first 3 threads)
@@ -178,6 +192,7 @@ class UserOnboarding:
         # Priority 3: Mid-execution tip (contextual, first long response)
         if response_duration > 20.0 and s.tips_shown.get("mid_execution") is None:
             s.tips_shown["mid_execution"] = _now()
+            self._dirty = True
             return TIP_MID_EXECUTION
 
         # Priority 4-5: Count-based tips (only on new threads)
@@ -190,18 +205,26 @@ class UserOnboarding:
         ]:
             if s.tips_shown.get(name) is None:
                 s.tips_shown[name] = _now()
+                self._dirty = True
                 return text
 
         return ""
 
     async def save(self) -> None:
-        """Persist onboarding state to disk. Best-effort — never raises."""
+        """Persist onboarding state to disk. Best-effort — never raises.
+
+        Does nothing if the state hasn't changed since it was loaded or
+        last saved -- most messages land in a thread the user already has.
+        """
+        if not self._dirty:
+            return
         try:
             path = USERS_DIR / self._user_id / "onboarding.json"
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp = path.with_suffix(".tmp")
             tmp.write_text(json.dumps(asdict(self._state), indent=2))
             tmp.rename(path)  # Atomic on POSIX
+            self._dirty = False
         except Exception:
             logger.debug(
                 "Failed to save onboarding state for %s",
@@ -14,6 +14,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Awaitable, Callable
 
+from hive_slack.admin import manager as admin_events
 from hive_slack.config import HiveSlackConfig
 
 logger = logging.getLogger(__name__)
@@ -53,7 +54,10 @@ class InProcessSessionManager:
         # Worker lifecycle manager -- shared across all dispatch tools
         from hive_slack.worker_manager import WorkerManager
 
-        self._worker_manager = WorkerManager(timeout=600.0)  # 10 min default
+        self._worker_manager = WorkerManager(
+            timeout=600.0,  # 10 min default
+            max_concurrent=config.max_workers,
+        )
         self._watchdog_task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
@@ -166,6 +170,7 @@ class InProcessSessionManager:
         self._watchdog_task = asyncio.create_task(
             self._worker_manager.run_timeout_watchdog()
         )
+        admin_events.broadcast({"type": "service", "state": "started"})
 
     @staticmethod
     def _detect_provider() -> dict | None:
@@ -745,6 +750,9 @@ class InProcessSessionManager:
             )
 
             self._sessions[session_key] = session
+            admin_events.broadcast(
+                {"type": "service", "state": "session_created", "key": session_key}
+            )
         return self._sessions[session_key]
 
     async def _wrap_recipes_tool(
@@ -913,7 +921,12 @@ class InProcessSessionManager:
                         "task_id": info.task_id,
                         "description": info.description,
                         "tier": info.tier,
-                        "elapsed_seconds": now - info.started_at,
+                        "elapsed_seconds": (
+                            now - info.started_at
+                            if info.started_at is not None
+                            else 0.0
+                        ),
+                        "queued": info.started_at is None,
                     }
                 )
         except Exception:
@@ -992,3 +1005,4 @@ class InProcessSessionManager:
         self._locks.clear()
         self._approval_systems.clear()
         self._capability_warned.clear()
+        admin_events.broadcast({"type": "service", "state": "stopped"})
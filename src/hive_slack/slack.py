@@ -94,6 +94,8 @@ class SlackConnector:
         self._channel_config = ChannelConfigCache(
             self._app.client, list(self._config.instance_names), ttl=60
         )
+        # Seeds the cache from users.conversations at startup
+        self._prewarm_task: asyncio.Task[None] | None = None
 
         # Track messages we've already handled (prevent double-processing)
         self._handled_messages: OrderedDict[str, None] = OrderedDict()
@@ -1317,11 +1319,15 @@ class SlackConnector:
 
     async def start(self) -> None:
         """Start the Socket Mode handler (blocks until stopped)."""
+        # Load channel routing while the websocket connects
+        self._prewarm_task = asyncio.create_task(self._channel_config.prewarm())
         await self._connection.start()
         self._bot_user_id = self._connection.bot_user_id
 
     async def stop(self) -> None:
         """Stop the Socket Mode handler."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
         await self._connection.stop()
 
     async def reconnect(self) -> None:
@@ -1,8 +1,9 @@
 """Structured read/write for TASKS.md (The Director's memory).
 
 Replaces the fragile line-by-line parsing in dispatch.py with a proper
-section-based parser. All mutations go through an asyncio.Lock and
-writes use a temp-file + rename pattern for atomicity.
+section-based parser. All mutations are applied by a single writer task
+and writes use a temp-file + rename pattern for atomicity. File I/O runs
+in a worker thread so dispatches never block the event loop.
 """
 
 from __future__ import annotations
@@ -15,6 +16,7 @@ import tempfile
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -191,7 +193,14 @@ class TaskStore:
 
     def __init__(self, path: Path) -> None:
         self._path = path
-        self._lock = asyncio.Lock()
+        # Mutations waiting for the writer, each with a future to resolve
+        # once it is on disk. See _apply.
+        self._queue: list[tuple[Callable[[TaskFile], None], asyncio.Future[None]]] = []
+        self._writer: asyncio.Task[None] | None = None
+        # Parsed copy of our own last write, keyed by the file's stat
+        # fingerprint. The Director also edits TASKS.md, so the file stays
+        # the source of truth -- the cache is only reused while it matches.
+        self._cached: tuple[tuple[int, int, int], TaskFile] | None = None
 
     @property
     def path(self) -> Path:
@@ -204,6 +213,20 @@ class TaskStore:
             return parse_tasks(self._path.read_text(encoding="utf-8"))
         return parse_tasks("")
 
+    def _fingerprint(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _load(self) -> TaskFile:
+        """Like _read, but reuse our last write if the file is unchanged."""
+        cached, self._cached = self._cached, None
+        if cached is not None and cached[0] == self._fingerprint():
+            return cached[1]
+        return self._read()
+
     def _write(self, tf: TaskFile) -> None:
         """Atomic write: temp-file in same dir, then os.replace."""
         content = render_tasks(tf)
@@ -216,6 +239,9 @@ class TaskStore:
             os.close(fd)
             fd = -1
             os.replace(tmp, str(self._path))
+            fingerprint = self._fingerprint()
+            if fingerprint is not None:
+                self._cached = (fingerprint, tf)
         except BaseException:
             if fd >= 0:
                 os.close(fd)
@@ -223,53 +249,96 @@ class TaskStore:
                 os.unlink(tmp)
             raise
 
-    # -- public operations (all lock-protected) ------------------------------
+    def _update(self, mutations: list[Callable[[TaskFile], None]]) -> None:
+        """Read, apply ``mutations`` in order, and write back once."""
+        tf = self._load()
+        for mutate in mutations:
+            mutate(tf)
+        self._write(tf)
+
+    async def _apply(self, mutate: Callable[[TaskFile], None]) -> None:
+        """Queue ``mutate`` and wait until it has been written.
+
+        Mutations that arrive while a write is in flight are applied
+        together in the next one, so a burst of worker transitions costs
+        one rewrite instead of one each.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.append((mutate, future))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+        await future
+
+    async def _drain(self) -> None:
+        """Writer task: flush queued mutations until the queue is empty."""
+        while self._queue:
+            batch, self._queue = self._queue, []
+            try:
+                await asyncio.to_thread(self._update, [m for m, _ in batch])
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
+    # -- public operations (serialized by the writer task) -------------------
 
     async def add_active(self, task_id: str, description: str) -> None:
         """Add a new task to the Active section."""
-        async with self._lock:
-            tf = self._read()
-            task = Task(
-                id=task_id,
-                fields={
-                    "description": sanitize_value(description[:200]),
-                    "started": date.today().isoformat(),
-                    "status": "worker dispatched",
-                },
-            )
+        task = Task(
+            id=task_id,
+            fields={
+                "description": sanitize_value(description[:200]),
+                "started": date.today().isoformat(),
+                "status": "worker dispatched",
+            },
+        )
+
+        def mutate(tf: TaskFile) -> None:
             tf.get_section(SECTION_ACTIVE).insert(0, task)
-            self._write(tf)
+
+        await self._apply(mutate)
         logger.info("Added %s to TASKS.md Active", task_id)
 
     async def complete_task(self, task_id: str, summary: str) -> None:
         """Move a task from its current section to Done."""
-        async with self._lock:
-            tf = self._read()
+        done = Task(
+            id=task_id,
+            fields={
+                "completed": date.today().isoformat(),
+                "summary": sanitize_value(summary),
+            },
+        )
+
+        def mutate(tf: TaskFile) -> None:
             old = tf.remove_task(task_id)
-            done = Task(
-                id=task_id,
-                fields={
-                    "completed": date.today().isoformat(),
-                    "summary": sanitize_value(summary),
-                },
-            )
             if old and old.fields.get("artifacts"):
                 done.fields["artifacts"] = old.fields["artifacts"]
             tf.get_section(SECTION_DONE).insert(0, done)
-            self._write(tf)
+
+        await self._apply(mutate)
         logger.info("Moved %s to TASKS.md Done", task_id)
 
     async def fail_task(self, task_id: str, error: str) -> None:
         """Mark a specific task as failed (by task_id, not blind replace)."""
-        async with self._lock:
-            tf = self._read()
+        status = f"failed -- {sanitize_value(error[:200])}"
+
+        def mutate(tf: TaskFile) -> None:
             result = tf.find_task(task_id)
             if result:
                 _, task = result
-                task.fields["status"] = f"failed -- {sanitize_value(error[:200])}"
-            self._write(tf)
+                task.fields["status"] = status
+
+        await self._apply(mutate)
         logger.info("Marked %s as failed in TASKS.md", task_id)
 
     async def read_all(self) -> TaskFile:
         """Read the current state (no lock needed -- snapshot read)."""
-        return self._read()
+        return await asyncio.to_thread(self._read)
@@ -10,7 +10,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from typing import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,8 @@ class WorkerInfo:
     task_id: str
     description: str
     task: asyncio.Task
-    started_at: float = field(default_factory=time.monotonic)
+    # None while the worker is still queued for a run slot
+    started_at: float | None = field(default_factory=time.monotonic)
     tier: str = ""
 
 
@@ -31,27 +34,62 @@ class WorkerManager:
 
     Usage:
         manager = WorkerManager(timeout=600)  # 10 min default
-        manager.register("TASK-007", task, "Research fire pit options")
+        manager.register("TASK-007", task, "Research fire pit options", queued=True)
         ...
+        async with manager.slot():  # inside the worker
+            ...
         active = manager.get_active()
         manager.cancel("TASK-007")
         await manager.cancel_all()  # on shutdown
     """
 
-    def __init__(self, timeout: float = 600.0) -> None:
+    def __init__(self, timeout: float = 600.0, max_concurrent: int = 4) -> None:
         self._workers: dict[str, WorkerInfo] = {}
+        # Strong refs to every unfinished task and its own info, including
+        # ones whose entry in _workers was replaced by a newer worker with
+        # the same task_id
+        self._tasks: dict[asyncio.Task, WorkerInfo] = {}
         self._timeout = timeout
+        # Caps how many workers run a session at once; the rest queue
+        self._slots = asyncio.Semaphore(max_concurrent)
 
     def register(
-        self, task_id: str, task: asyncio.Task, description: str = "", tier: str = ""
+        self,
+        task_id: str,
+        task: asyncio.Task,
+        description: str = "",
+        tier: str = "",
+        queued: bool = False,
     ) -> None:
-        """Register a new worker task for tracking."""
+        """Register a new worker task for tracking.
+
+        Pass ``queued=True`` for workers that wait in :meth:`slot` before
+        running; their timeout clock doesn't start until they get a slot.
+        """
         if task_id in self._workers:
             logger.warning("Worker %s already registered, replacing", task_id)
-        self._workers[task_id] = WorkerInfo(
+        info = WorkerInfo(
             task_id=task_id, description=description, task=task, tier=tier
         )
-        task.add_done_callback(lambda _t, tid=task_id: self._on_done(tid))
+        if queued:
+            info.started_at = None
+        self._workers[task_id] = info
+        self._tasks[task] = info
+        task.add_done_callback(lambda t, tid=task_id: self._on_done(tid, t))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``max_concurrent`` run slots for the block.
+
+        Must be entered from the registered worker task itself. Its
+        timeout clock starts once the slot is acquired, so time spent
+        queued doesn't count against the worker.
+        """
+        async with self._slots:
+            info = self._tasks.get(asyncio.current_task())
+            if info is not None:
+                info.started_at = time.monotonic()
+            yield
 
     def unregister(self, task_id: str) -> None:
         """Remove a worker from tracking."""
@@ -96,12 +134,15 @@ class WorkerManager:
         """Periodically cancel workers that exceed the timeout.
 
         Runs in a loop. Workers that exceed ``self._timeout`` seconds
-        are cancelled automatically.
+        are cancelled automatically; workers still queued for a slot are
+        left alone.
         """
         while True:
             await asyncio.sleep(interval)
             now = time.monotonic()
-            for info in self.get_active():
+            for info in list(self._tasks.values()):
+                if info.started_at is None or info.task.done():
+                    continue
                 elapsed = now - info.started_at
                 if elapsed > self._timeout:
                     logger.warning(
@@ -112,11 +153,13 @@ class WorkerManager:
                     )
                     info.task.cancel()
 
-    def _on_done(self, task_id: str) -> None:
+    def _on_done(self, task_id: str, task: asyncio.Task) -> None:
         """Done callback -- log completion and clean up."""
-        info = self._workers.pop(task_id, None)
-        if info is None:
-            return
+        self._tasks.pop(task, None)
+        info = self._workers.get(task_id)
+        if info is None or info.task is not task:
+            return  # Unregistered, or replaced by a newer worker
+        del self._workers[task_id]
 
         if info.task.cancelled():
             logger.info("Worker %s was cancelled", task_id)
@@ -128,6 +171,8 @@ class WorkerManager:
                 exc,
                 exc_info=exc,
             )
+        elif info.started_at is None:
+            logger.info("Worker %s completed", task_id)
         else:
             elapsed = time.monotonic() - info.started_at
             logger.info("Worker %s completed in %.1fs", task_id, elapsed)
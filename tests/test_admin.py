@@ -1,5 +1,6 @@
 """Tests for the admin UI components."""
 
+import asyncio
 import os
 import time
 
@@ -73,33 +74,188 @@ class TestAdminHelpers:
         name, key = _detect_provider_info()
         assert "None" in name
 
+    async def test_list_dir_counts_and_caches(self, tmp_path):
+        from hive_slack.admin.configuration import _list_dir
+
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_text("hello")
+
+        listing = await _list_dir(tmp_path)
+        assert listing.dir_count == 1
+        assert listing.file_count == 1
+        assert listing.dirs == ["sub"]
+        assert listing.files == [("a.txt", 5)]
+
+        # Unchanged directory within the TTL -- served from cache
+        assert await _list_dir(tmp_path) is listing
+
+    def test_cached_json_etag_revalidation(self):
+        from starlette.requests import Request
+        from hive_slack.admin.shared import cached_json
+
+        first = cached_json(Request({"type": "http", "headers": []}), {"a": 1})
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        request = Request(
+            {"type": "http", "headers": [(b"if-none-match", etag.encode())]}
+        )
+        second = cached_json(request, {"a": 1})
+        assert second.status_code == 304
+        assert second.body == b""
+        assert cached_json(request, {"a": 2}).status_code == 200
+
+    def test_verify_password(self, monkeypatch):
+        import hashlib
+        import hive_slack.admin as admin_state
+        from hive_slack.admin.auth import verify_password
+
+        monkeypatch.setattr(
+            admin_state, "_password_hash", hashlib.sha256(b"secret").hexdigest()
+        )
+        assert verify_password("secret") is True
+        assert verify_password("wrong") is False
+
+    def test_verify_password_malformed_hash_rejects(self, monkeypatch):
+        import hive_slack.admin as admin_state
+        from hive_slack.admin.auth import verify_password
+
+        monkeypatch.setattr(admin_state, "_password_hash", "not-hex")
+        assert verify_password("anything") is False
+
     def test_nicegui_available(self):
         """NiceGUI should be available since we installed it."""
         from hive_slack.main import _nicegui_available
         assert _nicegui_available() is True
 
 
+class TestSaveTokens:
+    """Test the .env rewrite used by the Slack setup page."""
+
+    def test_updates_in_place_and_appends(self, tmp_path):
+        from hive_slack.admin.slack_setup import _write_env_tokens
+
+        env = tmp_path / ".env"
+        env.write_text("# Slack\nSLACK_BOT_TOKEN=old\n\nOTHER=1\n")
+
+        changed = _write_env_tokens(
+            env, {"SLACK_BOT_TOKEN": "xoxb-new", "SLACK_APP_TOKEN": "xapp-1"}
+        )
+
+        assert changed is True
+        assert env.read_text() == (
+            "# Slack\nSLACK_BOT_TOKEN=xoxb-new\n\nOTHER=1\nSLACK_APP_TOKEN=xapp-1\n"
+        )
+
+    def test_unchanged_values_skip_write(self, tmp_path):
+        from hive_slack.admin.slack_setup import _write_env_tokens
+
+        env = tmp_path / ".env"
+        env.write_text("SLACK_BOT_TOKEN=xoxb-1\n")
+        before = env.stat().st_mtime_ns
+
+        assert _write_env_tokens(env, {"SLACK_BOT_TOKEN": "xoxb-1"}) is False
+        assert env.stat().st_mtime_ns == before
+
+
 class TestLogBuffer:
     """Test the ring buffer log handler."""
 
     def test_log_records_captured(self):
         import logging
-        from hive_slack.admin.logs import _log_buffer
+        from hive_slack.admin._log_sink import _log_buffer, install
+
+        install()
 
         initial = len(_log_buffer)
         logger = logging.getLogger("test.admin.buffer")
         logger.warning("test warning message")
         assert len(_log_buffer) > initial
 
+    def test_entries_are_formatted_on_display(self):
+        import logging
+        from hive_slack.admin._log_sink import _log_buffer, install
+        from hive_slack.admin.logs import _format_entry
+
+        install()
+
+        logging.getLogger("test.admin.lazy").warning("count=%d", 3)
+        entry = _log_buffer[-1]
+        assert entry[3:] == ("count=%d", (3,))
+        line = _format_entry(entry)
+        assert "WARNING" in line
+        assert line.endswith("count=3")
+
+    def test_flush_broadcasts_pending_records_as_one_batch(self, monkeypatch):
+        import hive_slack.admin as admin_state
+        from hive_slack.admin import _log_sink
+
+        sent = []
+        monkeypatch.setattr(admin_state.manager, "broadcast", sent.append)
+        _log_sink._pending[:] = [{"message": "a"}, {"message": "b"}]
+
+        _log_sink._flush()
+
+        assert sent == [
+            {"type": "log_append", "records": [{"message": "a"}, {"message": "b"}]}
+        ]
+        assert _log_sink._pending == []
+
+    def test_flush_flags_new_errors_once(self, monkeypatch):
+        import hive_slack.admin as admin_state
+        from hive_slack.admin import _log_sink
+
+        sent = []
+        monkeypatch.setattr(admin_state.manager, "broadcast", sent.append)
+        monkeypatch.setattr(_log_sink, "_pending_error", True)
+
+        _log_sink._flush()
+        _log_sink._flush()
+
+        assert sent == [{"type": "log_error"}]
+
     def test_error_capture(self):
         import logging
-        from hive_slack.admin.dashboard import _recent_errors
+        from hive_slack.admin._log_sink import _recent_errors, install
+
+        install()
 
         initial = len(_recent_errors)
         logger = logging.getLogger("test.admin.errors")
         logger.warning("test error for dashboard")
         assert len(_recent_errors) > initial
 
+    def test_install_is_idempotent(self):
+        import logging
+        from hive_slack.admin._log_sink import _AdminSink, install
+
+        install()
+        install()
+        sinks = [h for h in logging.getLogger().handlers if isinstance(h, _AdminSink)]
+        assert len(sinks) == 1
+
+
+class TestConnectionManager:
+    """Test event fan-out to admin clients."""
+
+    async def test_subscribers_only_get_their_event_types(self):
+        from hive_slack.admin import ConnectionManager
+
+        manager = ConnectionManager()
+        everything = manager.subscribe()
+        state_only = manager.subscribe(types=("connection", "service"))
+
+        manager.broadcast({"type": "log_append", "records": []})
+        manager.broadcast({"type": "connection", "state": "connected"})
+        await asyncio.sleep(0)
+
+        assert everything.qsize() == 2
+        assert state_only.qsize() == 1
+        assert state_only.get_nowait()["type"] == "connection"
+
+        manager.unsubscribe(state_only)
+        assert manager.has_subscribers
+
 
 class TestCreateAdminApp:
     """Test admin app initialization."""
@@ -119,3 +275,22 @@ class TestCreateAdminApp:
         assert admin_state._connector is mock_connector
         assert admin_state._config is mock_config
         assert admin_state._start_time > 0
+
+    def test_create_admin_app_snapshots_environment(self, monkeypatch):
+        from unittest.mock import MagicMock
+        import hive_slack.admin as admin_state
+        from hive_slack.admin import create_admin_app
+        from hive_slack.admin.auth import get_password_hash
+
+        # Restore the module snapshots after the test
+        monkeypatch.setattr(admin_state, "_password_hash", None)
+        monkeypatch.setattr(admin_state, "_provider_info", None)
+
+        monkeypatch.setenv("ADMIN_PASSWORD_HASH", "abc123")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test12345678901234")
+        create_admin_app(MagicMock(), MagicMock(), MagicMock())
+
+        # Later environment changes don't leak into the running admin app
+        monkeypatch.setenv("ADMIN_PASSWORD_HASH", "changed")
+        assert get_password_hash() == "abc123"
+        assert "Anthropic" in admin_state._provider_info[0]
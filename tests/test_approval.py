@@ -26,9 +26,8 @@ class TestSlackApprovalSystem:
         # Resolve immediately in a background task
         async def resolve_soon():
             await asyncio.sleep(0.1)
-            for cid, (event, holder) in approval._pending.items():
-                holder.append("allow")
-                event.set()
+            for future in approval._pending.values():
+                future.set_result("allow")
                 break
 
         asyncio.create_task(resolve_soon())
@@ -72,15 +71,15 @@ class TestSlackApprovalSystem:
 
         async def resolve_soon():
             await asyncio.sleep(0.05)
-            for cid, (event, holder) in approval._pending.items():
-                holder.append("allow")
-                event.set()
+            for future in approval._pending.values():
+                future.set_result("allow")
                 break
 
         asyncio.create_task(resolve_soon())
         await approval.request_approval(
             "Delete?", ["allow", "deny"], timeout=5.0, default="deny"
         )
+        await approval.flush_updates()
 
         # chat_update should have been called to replace the buttons
         client.chat_update.assert_called_once()
@@ -88,21 +87,36 @@ class TestSlackApprovalSystem:
         assert update_kwargs["ts"] == "msg123"
         assert "allow" in update_kwargs["text"]
 
-    def test_resolve_approval_sets_event(self):
-        """resolve_approval resolves a pending approval."""
+    @pytest.mark.asyncio
+    async def test_queued_updates_for_same_message_coalesce(self):
+        """A newer update for the same message replaces the queued one."""
+        from hive_slack.approval import SlackApprovalSystem
+
+        client = AsyncMock()
+        approval = SlackApprovalSystem(client, "C123")
+
+        approval._queue_update("msg1", "first", [])
+        approval._queue_update("msg1", "second", [])
+        await approval.flush_updates()
+
+        client.chat_update.assert_called_once()
+        assert client.chat_update.call_args[1]["text"] == "second"
+
+    @pytest.mark.asyncio
+    async def test_resolve_approval_sets_result(self):
+        """resolve_approval resolves a pending approval; first click wins."""
         from hive_slack.approval import SlackApprovalSystem
 
         approval = SlackApprovalSystem(AsyncMock(), "C123")
 
-        event = asyncio.Event()
-        holder: list[str] = []
-        approval._pending["abc123"] = (event, holder)
+        future = asyncio.get_running_loop().create_future()
+        approval._pending["abc123"] = future
 
         resolved = approval.resolve_approval("approval_abc123_allow", "allow")
+        assert approval.resolve_approval("approval_abc123_deny", "deny") is True
 
         assert resolved is True
-        assert event.is_set()
-        assert holder == ["allow"]
+        assert future.result() == "allow"
 
     def test_resolve_unknown_returns_false(self):
         """resolve_approval returns False for unknown correlation IDs."""
@@ -118,6 +132,18 @@ class TestSlackApprovalSystem:
         approval = SlackApprovalSystem(AsyncMock(), "C123")
         assert approval.resolve_approval("something_else", "value") is False
 
+    @pytest.mark.asyncio
+    async def test_resolve_ignores_other_prefixes(self):
+        """Actions from other features never resolve a pending approval."""
+        from hive_slack.approval import SlackApprovalSystem
+
+        approval = SlackApprovalSystem(AsyncMock(), "C123")
+        future = asyncio.get_running_loop().create_future()
+        approval._pending["abc123"] = future
+
+        assert approval.resolve_approval("recipe_abc123_allow", "allow") is False
+        assert not future.done()
+
     @pytest.mark.asyncio
     async def test_pending_cleaned_up_after_resolution(self):
         """Pending entry is removed after request_approval completes."""
@@ -56,6 +56,25 @@ slack:
         assert config.slack.app_token == "xapp-secret"
         assert config.slack.bot_token == "xoxb-secret"
 
+    def test_env_vars_in_keys_are_not_substituted(self, tmp_path, monkeypatch):
+        """Only values are substituted; ${...} in a mapping key stays literal."""
+        monkeypatch.setenv("TEST_BOT_TOKEN", "xoxb-secret")
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+instances:
+  ${UNSET_KEY_VAR_12345}:
+    bundle: foundation
+    working_dir: /tmp/test
+slack:
+  app_token: test
+  bot_token: ${TEST_BOT_TOKEN}
+""")
+        config = HiveSlackConfig.from_yaml(str(config_file))
+
+        assert list(config.instances) == ["${UNSET_KEY_VAR_12345}"]
+        assert config.slack.bot_token == "xoxb-secret"
+
     def test_missing_env_var_raises_error(self, tmp_path):
         """Referencing an unset env var produces a clear error message."""
         config_file = tmp_path / "config.yaml"
@@ -161,6 +180,44 @@ slack:
         config = HiveSlackConfig.from_yaml(str(config_file))
         assert config.default_instance == "gamma"
 
+    def test_empty_defaults_section_falls_back_to_first(self, tmp_path):
+        """An empty defaults section behaves like a missing one."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+instances:
+  gamma:
+    bundle: foundation
+    working_dir: /tmp/gamma
+defaults:
+slack:
+  app_token: test
+  bot_token: test
+""")
+        config = HiveSlackConfig.from_yaml(str(config_file))
+        assert config.default_instance == "gamma"
+        assert config.max_workers == 4
+
+    def test_max_workers_from_defaults(self, tmp_path):
+        """defaults.max_workers sets the dispatch worker limit."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+instances:
+  gamma:
+    bundle: foundation
+    working_dir: /tmp/gamma
+defaults:
+  max_workers: 2
+slack:
+  app_token: test
+  bot_token: test
+""")
+        config = HiveSlackConfig.from_yaml(str(config_file))
+        assert config.max_workers == 2
+
+        config_file.write_text(config_file.read_text().replace("2", "0"))
+        with pytest.raises(ValueError, match="max_workers"):
+            HiveSlackConfig.from_yaml(str(config_file))
+
     def test_get_instance_returns_correct_config(self, tmp_path):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
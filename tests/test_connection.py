@@ -62,6 +62,70 @@ class TestConnectionTrackingFields:
         assert conn.started_at is not None
         assert before <= conn.started_at <= after
 
+    @pytest.mark.asyncio
+    async def test_start_shares_one_http_session_until_stop(self):
+        """start() gives the web client a pooled session; stop() closes it."""
+        import aiohttp
+
+        app = MagicMock()
+        app.client.session = None
+        app.client.timeout = 30
+        app.client.trust_env_in_session = False
+        app.client.auth_test = AsyncMock(return_value={"user_id": "U123"})
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            MockHandler.return_value = AsyncMock()
+            conn = SlackConnection(app, make_config())
+
+        await conn.start()
+        session = app.client.session
+        assert isinstance(session, aiohttp.ClientSession)
+        assert not session.closed
+
+        await conn.stop()
+        assert session.closed
+        assert app.client.session is None
+
+    @pytest.mark.asyncio
+    async def test_stop_leaves_caller_supplied_session_open(self):
+        """A session injected into the web client is not ours to close."""
+        import aiohttp
+
+        app = MagicMock()
+        own_session = aiohttp.ClientSession()
+        app.client.session = own_session
+        app.client.auth_test = AsyncMock(return_value={"user_id": "U123"})
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            MockHandler.return_value = AsyncMock()
+            conn = SlackConnection(app, make_config())
+
+        await conn.start()
+        await conn.stop()
+        try:
+            assert app.client.session is own_session
+            assert not own_session.closed
+        finally:
+            await own_session.close()
+
+    @pytest.mark.asyncio
+    async def test_state_changes_are_broadcast_to_admin(self):
+        """start(), reconnect() and stop() publish connection events."""
+        app = MagicMock()
+        app.client.session = None
+        app.client.timeout = 30
+        app.client.trust_env_in_session = False
+        app.client.auth_test = AsyncMock(return_value={"user_id": "U123"})
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            MockHandler.return_value = AsyncMock()
+            conn = SlackConnection(app, make_config())
+
+        with patch("hive_slack.connection.admin_events") as events:
+            await conn.start()
+            await conn.reconnect()
+            await conn.stop()
+
+        states = [c.args[0]["state"] for c in events.broadcast.call_args_list]
+        assert states == ["connected", "reconnected", "disconnected"]
+
     @pytest.mark.asyncio
     async def test_reconnect_increments_count(self):
         """Each reconnect() call increments the reconnect counter."""
@@ -77,6 +141,39 @@ class TestConnectionTrackingFields:
             await conn.reconnect()
             assert conn.reconnect_count == 2
 
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_handler(self):
+        """reconnect() swaps the websocket without rebuilding the handler."""
+        app = MagicMock()
+        config = make_config()
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            handler = AsyncMock()
+            MockHandler.return_value = handler
+            conn = SlackConnection(app, config)
+
+            await conn.reconnect()
+
+            assert MockHandler.call_count == 1
+            handler.client.connect_to_new_endpoint.assert_awaited_once_with(force=True)
+            handler.close_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_rebuilds_handler_on_failure(self):
+        """If the in-place reconnect fails, a fresh handler is created."""
+        app = MagicMock()
+        config = make_config()
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            broken = AsyncMock()
+            broken.client.connect_to_new_endpoint.side_effect = RuntimeError("boom")
+            fresh = AsyncMock()
+            MockHandler.side_effect = [broken, fresh]
+            conn = SlackConnection(app, config)
+
+            await conn.reconnect()
+
+            broken.close_async.assert_awaited_once()
+            fresh.connect_async.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_health_check_updates_timestamp(self):
         """Successful health check in watchdog updates last_health_check_at."""
@@ -103,6 +200,32 @@ class TestConnectionTrackingFields:
 
             assert conn.last_health_check_at is not None
 
+    @pytest.mark.asyncio
+    async def test_recent_activity_skips_auth_test(self):
+        """A recent inbound event stands in for the auth.test round-trip."""
+        app = MagicMock()
+        app.client.auth_test = AsyncMock(return_value={"ok": True})
+        config = make_config()
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            MockHandler.return_value = AsyncMock()
+            conn = SlackConnection(app, config)
+            await conn._track_activity(AsyncMock())
+
+            iteration = 0
+
+            async def fake_sleep(_interval):
+                nonlocal iteration
+                iteration += 1
+                if iteration > 8:
+                    raise asyncio.CancelledError
+
+            with patch("asyncio.sleep", side_effect=fake_sleep):
+                with pytest.raises(asyncio.CancelledError):
+                    await conn.run_watchdog(interval=15.0)
+
+            app.client.auth_test.assert_not_awaited()
+            assert conn.last_health_check_at is not None
+
     @pytest.mark.asyncio
     async def test_failed_health_check_does_not_update_timestamp(self):
         """Failed health check leaves last_health_check_at unchanged."""
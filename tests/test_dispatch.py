@@ -315,6 +315,138 @@ class TestMultipleDispatches:
         done_ids = {t.id for t in tf.get_section(SECTION_DONE)}
         assert done_ids == {"task-a", "task-b"}
 
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_are_capped(
+        self,
+        manager: FakeSessionManager,
+        working_dir: Path,
+    ):
+        from hive_slack.worker_manager import WorkerManager
+
+        tool = DispatchWorkerTool(
+            session_manager=manager,
+            instance_name="alpha",
+            working_dir=str(working_dir),
+            director_conversation_id="test-channel:director",
+            worker_manager=WorkerManager(max_concurrent=1),
+        )
+        release = asyncio.Event()
+        in_flight = 0
+        peak = 0
+
+        async def blocking_execute(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return "done"
+
+        manager.execute = AsyncMock(side_effect=blocking_execute)
+
+        await tool.execute({"task": "Task A", "task_id": "task-a"})
+        await tool.execute({"task": "Task B", "task_id": "task-b"})
+        await asyncio.sleep(0.1)
+        assert manager.execute.await_count == 1  # task-b is queued
+
+        release.set()
+        await asyncio.sleep(0.2)
+
+        assert peak == 1
+        done_ids = {t.id for t in read_tasks(working_dir).get_section(SECTION_DONE)}
+        assert done_ids == {"task-a", "task-b"}
+
+    @pytest.mark.asyncio
+    async def test_queued_worker_is_not_timed_out(self):
+        """Time spent waiting for a slot doesn't count against the timeout."""
+        from hive_slack.worker_manager import WorkerManager
+
+        workers = WorkerManager(timeout=0.3, max_concurrent=1)
+        ran: list[str] = []
+
+        async def work(name: str, duration: float) -> None:
+            async with workers.slot():
+                ran.append(name)
+                await asyncio.sleep(duration)
+
+        # C waits 0.35s for its slot -- longer than the timeout
+        for name, duration in (("A", 0.2), ("B", 0.15), ("C", 0.05)):
+            task = asyncio.create_task(work(name, duration))
+            workers.register(name, task, queued=True)
+        watchdog = asyncio.create_task(workers.run_timeout_watchdog(interval=0.02))
+        try:
+            await asyncio.sleep(0.6)
+        finally:
+            watchdog.cancel()
+
+        assert ran == ["A", "B", "C"]
+        assert workers.get_all() == []
+
+    @pytest.mark.asyncio
+    async def test_slot_starts_the_callers_own_clock(self):
+        """A replaced worker taking its slot doesn't start the newer one's clock."""
+        from hive_slack.worker_manager import WorkerManager
+
+        workers = WorkerManager(max_concurrent=1)
+        release = asyncio.Event()
+
+        async def work() -> None:
+            async with workers.slot():
+                await release.wait()
+
+        first = asyncio.create_task(work())
+        workers.register("dup", first, queued=True)
+        second = asyncio.create_task(work())
+        workers.register("dup", second, queued=True)
+        await asyncio.sleep(0.05)
+
+        # The first worker holds the slot; the tracked (second) one is queued
+        assert workers._tasks[first].started_at is not None
+        assert [w.started_at for w in workers.get_all()] == [None]
+
+        release.set()
+        await asyncio.gather(first, second)
+
+    @pytest.mark.asyncio
+    async def test_reused_task_id_keeps_newer_worker_tracked(
+        self,
+        manager: FakeSessionManager,
+        working_dir: Path,
+    ):
+        from hive_slack.worker_manager import WorkerManager
+
+        workers = WorkerManager()
+        tool = DispatchWorkerTool(
+            session_manager=manager,
+            instance_name="alpha",
+            working_dir=str(working_dir),
+            director_conversation_id="test-channel:director",
+            worker_manager=workers,
+        )
+        first_done = asyncio.Event()
+        second_done = asyncio.Event()
+        gates = [first_done, second_done]
+
+        async def gated_execute(*args, **kwargs):
+            await gates.pop(0).wait()
+            return "done"
+
+        manager.execute = AsyncMock(side_effect=gated_execute)
+
+        await tool.execute({"task": "First try", "task_id": "dup"})
+        await tool.execute({"task": "Second try", "task_id": "dup"})
+        await asyncio.sleep(0.05)
+
+        first_done.set()
+        await asyncio.sleep(0.1)
+
+        # The first worker finishing must not drop the second one's entry
+        assert [w.task_id for w in workers.get_active()] == ["dup"]
+
+        second_done.set()
+        await asyncio.sleep(0.1)
+        assert workers.get_all() == []
+
 
 # ---------------------------------------------------------------------------
 # _build_verifier_prompt
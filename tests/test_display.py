@@ -38,28 +38,22 @@ class TestSlackDisplaySystem:
 
     def test_show_message_warning_prefix(self):
         """Warning messages get ⚠️ prefix."""
-        from hive_slack.display import SlackDisplaySystem
+        from hive_slack.display import _LEVEL_PREFIX
 
-        client = AsyncMock()
-        display = SlackDisplaySystem(client, "C123")
-        # Verify prefix logic by checking the prefix map behavior
-        # show_message is fire-and-forget so we test the prefix construction
-        prefix = {"warning": "⚠️ ", "error": "🚨 "}.get("warning", "")
-        assert prefix == "⚠️ "
+        # show_message is fire-and-forget so we test the prefix map directly
+        assert _LEVEL_PREFIX["warning"] == "⚠️ "
 
     def test_show_message_error_prefix(self):
         """Error messages get 🚨 prefix."""
-        from hive_slack.display import SlackDisplaySystem
+        from hive_slack.display import _LEVEL_PREFIX
 
-        prefix = {"warning": "⚠️ ", "error": "🚨 "}.get("error", "")
-        assert prefix == "🚨 "
+        assert _LEVEL_PREFIX["error"] == "🚨 "
 
     def test_show_message_info_no_prefix(self):
         """Info messages have no prefix."""
-        from hive_slack.display import SlackDisplaySystem
+        from hive_slack.display import _LEVEL_PREFIX
 
-        prefix = {"warning": "⚠️ ", "error": "🚨 "}.get("info", "")
-        assert prefix == ""
+        assert "info" not in _LEVEL_PREFIX
 
     @pytest.mark.asyncio
     async def test_post_handles_api_error(self):
@@ -97,3 +91,35 @@ class TestSlackDisplaySystem:
         display = SlackDisplaySystem(client, "C123")
         # No running event loop — should not raise
         display.show_message("hello", "info")
+
+    @pytest.mark.asyncio
+    async def test_burst_is_posted_as_one_message(self):
+        """Messages shown before the sender runs share a single post."""
+        from hive_slack.display import SlackDisplaySystem
+
+        client = AsyncMock()
+        display = SlackDisplaySystem(client, "C123", "thread123")
+
+        display.show_message("one")
+        display.show_message("two", "warning")
+        display.show_message("three")
+        await asyncio.sleep(0.05)
+
+        client.chat_postMessage.assert_called_once_with(
+            channel="C123", thread_ts="thread123", text="one\n⚠️ two\nthree"
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_burst_is_split(self):
+        """A batch longer than the post limit is split between messages."""
+        from hive_slack.display import _MAX_POST_CHARS, SlackDisplaySystem
+
+        client = AsyncMock()
+        display = SlackDisplaySystem(client, "C123")
+
+        display.show_message("a" * (_MAX_POST_CHARS - 10))
+        display.show_message("b" * 20)
+        await asyncio.sleep(0.05)
+
+        texts = [c.kwargs["text"] for c in client.chat_postMessage.call_args_list]
+        assert texts == ["a" * (_MAX_POST_CHARS - 10), "b" * 20]
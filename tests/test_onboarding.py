@@ -44,6 +44,22 @@ class TestOnboardingState:
         assert (tmp_path / "U_NEW2" / "onboarding.json").exists()
 
 
+    @pytest.mark.asyncio
+    async def test_save_skips_write_when_unchanged(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("hive_slack.onboarding.USERS_DIR", tmp_path)
+        onboarding = await UserOnboarding.load("U_TEST")
+        onboarding.record_thread("C1:t1")
+        await onboarding.save()
+        path = tmp_path / "U_TEST" / "onboarding.json"
+        path.write_text("sentinel")
+
+        await onboarding.save()  # nothing changed since the last save
+        onboarding.record_thread("C1:t1")  # already seen -- still no change
+        await onboarding.save()
+
+        assert path.read_text() == "sentinel"
+
+
 class TestWelcome:
     """Test first-interaction detection."""
 
@@ -46,6 +46,13 @@ class TestInProcessSessionManager:
         with pytest.raises(RuntimeError, match="not started"):
             await manager.execute("alpha", "conv-1", "hello")
 
+    def test_worker_limit_comes_from_config(self):
+        """The shared WorkerManager runs at most config.max_workers at once."""
+        config = make_config()
+        config.max_workers = 2
+        manager = InProcessSessionManager(config)
+        assert manager._worker_manager._slots._value == 2
+
     @pytest.mark.asyncio
     async def test_execute_returns_session_response(self):
         """execute() returns the string from session.execute()."""
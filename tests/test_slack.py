@@ -360,6 +360,13 @@ class TestChannelTopicParsing:
         assert config.default == "alpha"
         assert config.mode == "roundtable"
 
+    def test_invalid_repeat_keeps_earlier_valid_directive(self):
+        config = SlackConnector._parse_channel_topic(
+            "[mode:roundtable] [mode:bogus] [name:x]", ["alpha", "beta"]
+        )
+        assert config.mode == "roundtable"
+        assert config.name == ""
+
     def test_case_insensitive(self):
         config = SlackConnector._parse_channel_topic(
             "[Instance:Alpha]", ["alpha", "beta"]
@@ -433,7 +440,7 @@ class TestHandleMessage:
         connector._bot_user_id = "UBOTID"
         # Pre-populate cache so we don't need real Slack API
         connector._channel_config._cache["C99999"] = ChannelConfig(instance="alpha")
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         mock_say = AsyncMock()
         event = {
@@ -462,7 +469,7 @@ class TestHandleMessage:
         connector._bot_user_id = "UBOTID"
         # Empty config = unconfigured
         connector._channel_config._cache["C99999"] = ChannelConfig()
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         event = {
             "text": "Hello?",
@@ -484,7 +491,7 @@ class TestHandleMessage:
         connector = SlackConnector(config, mock_service)
         connector._bot_user_id = "UBOTID"
         connector._channel_config._cache["C99999"] = ChannelConfig(default="alpha")
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         mock_say = AsyncMock()
         event = {
@@ -551,6 +558,110 @@ class TestChannelConfigName:
         assert config.name == ""
 
 
+class TestChannelConfigCache:
+    """Test ChannelConfigCache expiry, early refresh and eviction."""
+
+    @staticmethod
+    def make_cache():
+        from hive_slack.formatting import ChannelConfigCache
+
+        client = AsyncMock()
+        client.conversations_info.return_value = {
+            "channel": {"name": "general", "topic": {"value": "[mode:open]"}}
+        }
+        return ChannelConfigCache(client, ["alpha"], ttl=60), client
+
+    @pytest.mark.asyncio
+    async def test_second_get_served_from_cache(self):
+        cache, client = self.make_cache()
+
+        first = await cache.get("C1")
+        second = await cache.get("C1")
+
+        assert second is first
+        assert first.mode == "open"
+        client.conversations_info.assert_called_once()
+        assert cache._fetch_durations["C1"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_unlucky_draw_refreshes_before_expiry(self):
+        cache, client = self.make_cache()
+        cache._cache["C1"] = ChannelConfig()
+        cache._timestamps["C1"] = time.monotonic() - 50
+        cache._fetch_durations["C1"] = 1.0
+
+        # 1 - random() == 1 -> no jitter: 10s left, still fresh
+        with patch("hive_slack.formatting.random.random", return_value=0.0):
+            assert (await cache.get("C1")).mode is None
+        client.conversations_info.assert_not_called()
+
+        # Tiny 1 - random() -> ~20s of jitter for a 1s fetch: refresh now
+        with patch("hive_slack.formatting.random.random", return_value=1 - 1e-9):
+            assert (await cache.get("C1")).mode == "open"
+        client.conversations_info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_channel_evicted(self):
+        from hive_slack.formatting import ChannelConfigCache
+
+        client = AsyncMock()
+        client.conversations_info.return_value = {"channel": {}}
+        cache = ChannelConfigCache(client, ["alpha"], max_size=2)
+
+        await cache.get("C1")
+        await cache.get("C2")
+        await cache.get("C1")  # C1 is now the most recently used
+        await cache.get("C3")
+
+        assert list(cache._cache) == ["C1", "C3"]
+        assert set(cache._timestamps) == {"C1", "C3"}
+        assert set(cache._fetch_durations) == {"C1", "C3"}
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_cached_briefly(self):
+        cache, client = self.make_cache()
+        client.conversations_info.side_effect = RuntimeError("ratelimited")
+
+        await cache.get("C1")
+        await cache.get("C1")
+        client.conversations_info.assert_called_once()
+
+        # Expires after negative_ttl (10s) instead of the 60s ttl
+        cache._timestamps["C1"] -= 10
+        await cache.get("C1")
+        assert client.conversations_info.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_last_good_config(self):
+        cache, client = self.make_cache()
+        good = await cache.get("C1")
+        cache._timestamps["C1"] -= 60
+
+        client.conversations_info.side_effect = RuntimeError("ratelimited")
+
+        assert await cache.get("C1") is good
+
+    @pytest.mark.asyncio
+    async def test_prewarm_seeds_member_channels_across_pages(self):
+        cache, client = self.make_cache()
+        client.users_conversations.side_effect = [
+            {
+                "channels": [
+                    {"id": "C1", "name": "ops", "topic": {"value": "[instance:alpha]"}}
+                ],
+                "response_metadata": {"next_cursor": "page2"},
+            },
+            {"channels": [{"id": "C2", "name": "random", "topic": {"value": ""}}]},
+        ]
+
+        await cache.prewarm()
+
+        assert client.users_conversations.call_args_list[1][1]["cursor"] == "page2"
+        assert (await cache.get("C1")).instance == "alpha"
+        assert (await cache.get("C2")).name == "random"
+        client.conversations_info.assert_not_called()
+
+
 class TestContextEnrichmentInHandlers:
     """Test that handlers pass enriched prompts to execute()."""
 
@@ -590,7 +701,7 @@ class TestContextEnrichmentInHandlers:
         connector._channel_config._cache["C99999"] = ChannelConfig(
             instance="alpha", name="coding"
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         mock_say = AsyncMock()
         event = {
@@ -869,7 +980,7 @@ class TestFileUpload:
         connector._channel_config._cache["C99999"] = ChannelConfig(
             instance="alpha", name="test"
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         event = {
             "text": "check this out",
@@ -913,7 +1024,7 @@ class TestFileUpload:
         connector._channel_config._cache["C99999"] = ChannelConfig(
             instance="alpha", name="test"
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         event = {
             "text": "",
@@ -1399,7 +1510,7 @@ class TestMessageQueuing:
         connector._channel_config._cache["C99999"] = ChannelConfig(
             instance="alpha", name="test"
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         # Simulate an active execution
         conv_id = "C99999:1234567890.000000"
@@ -1445,7 +1556,7 @@ class TestMessageQueuing:
         connector._channel_config._cache["C99999"] = ChannelConfig(
             instance="alpha", name="test"
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
 
         conv_id = "C99999:1234567890.000000"
         connector._active_executions[conv_id] = {
@@ -1688,7 +1799,7 @@ class TestEmojiSummoning:
         connector._app.client.conversations_info = AsyncMock(
             return_value={"channel": {"name": "general", "topic": {"value": ""}}}
         )
-        connector._channel_config._timestamps["C99999"] = time.time()
+        connector._channel_config._timestamps["C99999"] = time.monotonic()
         connector._channel_config._cache["C99999"] = ChannelConfig(name="general")
 
         event = {
@@ -1998,11 +2109,30 @@ class TestReconnect:
     """Test the reconnect method for refreshing Socket Mode connections."""
 
     @pytest.mark.asyncio
-    async def test_reconnect_closes_old_and_opens_new(self):
-        """Reconnect closes the old handler and creates a fresh one."""
+    async def test_reconnect_swaps_websocket_in_place(self):
+        """Reconnect reuses the handler and asks its client for a new endpoint."""
         config = make_config()
         connector = SlackConnector(config, AsyncMock())
-        connector._connection._handler = AsyncMock()
+        handler = AsyncMock()
+        connector._connection._handler = handler
+
+        with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
+            await connector.reconnect()
+
+            MockHandler.assert_not_called()
+            handler.client.connect_to_new_endpoint.assert_awaited_once_with(
+                force=True
+            )
+            assert connector._connection._handler is handler
+
+    @pytest.mark.asyncio
+    async def test_reconnect_rebuilds_handler_when_in_place_fails(self):
+        """If the in-place reconnect fails, the old handler is replaced."""
+        config = make_config()
+        connector = SlackConnector(config, AsyncMock())
+        old_handler = AsyncMock()
+        old_handler.client.connect_to_new_endpoint.side_effect = RuntimeError("down")
+        connector._connection._handler = old_handler
 
         with patch("hive_slack.connection.AsyncSocketModeHandler") as MockHandler:
             new_handler = AsyncMock()
@@ -2010,11 +2140,10 @@ class TestReconnect:
 
             await connector.reconnect()
 
-            # New handler was created with correct args
+            # New handler was created with correct args and connected
             MockHandler.assert_called_once_with(
                 connector._connection._app, config.slack.app_token
             )
-            # New handler was connected
             new_handler.connect_async.assert_called_once()
 
     @pytest.mark.asyncio
@@ -2023,6 +2152,7 @@ class TestReconnect:
         config = make_config()
         connector = SlackConnector(config, AsyncMock())
         old_handler = AsyncMock()
+        old_handler.client.connect_to_new_endpoint.side_effect = RuntimeError("down")
         old_handler.close_async.side_effect = RuntimeError("socket gone")
         connector._connection._handler = old_handler
 
@@ -2041,14 +2171,14 @@ class TestConnectionWatchdog:
 
     @pytest.mark.asyncio
     async def test_detects_time_jump_and_reconnects(self):
-        """A wall-clock jump triggers reconnect (simulates OS suspend/resume)."""
+        """A suspend-aware clock jump triggers reconnect (OS suspend/resume)."""
         config = make_config()
         connector = SlackConnector(config, AsyncMock())
         connector._connection.reconnect = AsyncMock()
 
-        # time.time() is called once for init (last_wall) and once per loop
-        # iteration (now_wall). A 300s jump between init and first loop tick
-        # with near-zero monotonic elapsed triggers the reconnect.
+        # The suspend-aware clock is read once for init (last_boot) and once
+        # per loop iteration (now_boot). A 300s jump between init and first
+        # loop tick with near-zero monotonic elapsed triggers the reconnect.
         # Call sequence: init=1000, after first sleep=1300 (jumped!)
         wall_times = [1000.0, 1300.0]
         time_call = 0
@@ -2071,7 +2201,9 @@ class TestConnectionWatchdog:
 
         with (
             patch("asyncio.sleep", side_effect=fake_sleep),
-            patch("time.time", side_effect=fake_time),
+            patch(
+                "hive_slack.connection._suspend_aware_clock", side_effect=fake_time
+            ),
         ):
             with pytest.raises(asyncio.CancelledError):
                 await connector.run_watchdog(interval=15.0)
@@ -2225,6 +2357,56 @@ class TestFormatUptime:
         assert _format_uptime(86400) == "1d"
 
 
+class TestMarkdownToSlackFastPaths:
+    """Test the cache and plain-text shortcuts in markdown_to_slack."""
+
+    def test_repeated_message_hits_cache(self):
+        from hive_slack.formatting import _markdown_to_slack_cached, markdown_to_slack
+
+        _markdown_to_slack_cached.cache_clear()
+        first = markdown_to_slack("**Done** see [docs](https://x.test)")
+        second = markdown_to_slack("**Done** see [docs](https://x.test)")
+
+        assert first == second == "*Done* see <https://x.test|docs>"
+        info = _markdown_to_slack_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_plain_text_skips_conversion(self):
+        from hive_slack.formatting import _markdown_to_slack_cached, markdown_to_slack
+
+        _markdown_to_slack_cached.cache_clear()
+
+        assert markdown_to_slack("  \u2699\ufe0f Alpha \u00b7 12s\n") == (
+            "\u2699\ufe0f Alpha \u00b7 12s"
+        )
+        assert markdown_to_slack("a\n\n\n\nb") == "a\n\nb"
+        assert _markdown_to_slack_cached.cache_info().currsize == 1
+
+    def test_long_message_bypasses_cache(self):
+        from hive_slack.formatting import (
+            _MARKDOWN_CACHE_MAX_CHARS,
+            _markdown_to_slack_cached,
+            markdown_to_slack,
+        )
+
+        _markdown_to_slack_cached.cache_clear()
+        text = "**x** " * (_MARKDOWN_CACHE_MAX_CHARS // 6 + 1)
+
+        assert markdown_to_slack(text).startswith("*x* *x*")
+        assert _markdown_to_slack_cached.cache_info().currsize == 0
+
+
+class TestMarkdownToSlackProtection:
+    """Test that code spans survive conversion untouched."""
+
+    def test_many_code_spans_restored_in_place(self):
+        from hive_slack.formatting import markdown_to_slack
+
+        spans = [f"`**{i}**`" for i in range(12)]
+
+        assert markdown_to_slack(" **and** ".join(spans)) == " *and* ".join(spans)
+
+
 class TestFormatStatus:
     """Test status dict -> plain text formatting."""
 
@@ -467,3 +467,64 @@ class TestTaskStoreReadAll:
         tf = loop.run_until_complete(task_store.read_all())
         assert len(tf.get_section(SECTION_ACTIVE)) == 1
         assert tf.get_section(SECTION_ACTIVE)[0].id == "snap"
+
+
+class TestTaskStoreParseCache:
+    async def test_consecutive_updates_skip_reparse(
+        self, task_store: TaskStore, monkeypatch: pytest.MonkeyPatch
+    ):
+        import hive_slack.task_store as task_store_mod
+
+        calls: list[str] = []
+        real_parse = task_store_mod.parse_tasks
+
+        def counting_parse(content: str):
+            calls.append(content)
+            return real_parse(content)
+
+        monkeypatch.setattr(task_store_mod, "parse_tasks", counting_parse)
+
+        await task_store.add_active("a", "First")
+        await task_store.add_active("b", "Second")
+        await task_store.complete_task("a", "Done A")
+
+        assert len(calls) == 1  # only the initial (missing-file) read
+        tf = real_parse(task_store.path.read_text())
+        assert [t.id for t in tf.get_section(SECTION_ACTIVE)] == ["b"]
+
+    async def test_external_edit_is_not_clobbered(self, task_store: TaskStore):
+        await task_store.add_active("a", "First")
+
+        # The Director edits TASKS.md directly between our writes
+        tf = parse_tasks(task_store.path.read_text())
+        tf.get_section(SECTION_PARKED).append(
+            Task(id="parked-1", fields={"note": "later"})
+        )
+        task_store.path.write_text(render_tasks(tf) + "\n")
+
+        await task_store.complete_task("a", "Done A")
+
+        tf = parse_tasks(task_store.path.read_text())
+        assert tf.get_section(SECTION_PARKED)[0].id == "parked-1"
+        assert tf.get_section(SECTION_DONE)[0].id == "a"
+
+    async def test_concurrent_updates_share_a_write(
+        self, task_store: TaskStore, monkeypatch: pytest.MonkeyPatch
+    ):
+        writes: list[int] = []
+        real_write = task_store._write
+
+        def counting_write(tf):
+            writes.append(1)
+            real_write(tf)
+
+        monkeypatch.setattr(task_store, "_write", counting_write)
+
+        await asyncio.gather(
+            *(task_store.add_active(f"task-{i}", f"Task {i}") for i in range(5))
+        )
+
+        # All five were queued before the writer ran, so one rewrite covers them
+        assert len(writes) == 1
+        tf = parse_tasks(task_store.path.read_text())
+        assert len(tf.get_section(SECTION_ACTIVE)) == 5